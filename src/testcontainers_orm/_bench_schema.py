@@ -0,0 +1,104 @@
+import random
+import sys
+import types
+from typing import Any
+from typing import Dict
+from typing import List
+
+# NOTE: Schemas of a given width used by the benchmark and tests of schema-wide features (DDL, required tables).
+# NOTE: Module is left private intentionally, it's not a part of public API.
+
+
+def generate_foreign_keys(
+    tables: int, fk_density: float, seed: int = 0
+) -> List[List[int]]:
+    """Return indexes of referenced tables for every table. Tables only reference preceding ones, so graph is acyclic.
+
+    `fk_density` is a probability of each table to reference one of preceding tables; values above 1 add more references.
+    """
+    rng = random.Random(seed)
+    foreign_keys: List[List[int]] = []
+    for index in range(tables):
+        references = []
+        density = fk_density
+        while index and density > 0:
+            if rng.random() < density:
+                references.append(rng.randrange(index))
+            density -= 1
+        foreign_keys.append(references)
+    return foreign_keys
+
+
+def _table_name(index: int) -> str:
+    return f'benchmark_{index:04d}'
+
+
+def generate_metadata(tables: int, fk_density: float, seed: int = 0):
+    """Generate SQLAlchemy metadata of a given width with a few columns of common types in every table."""
+    from sqlalchemy import TIMESTAMP  # type: ignore
+    from sqlalchemy import Column
+    from sqlalchemy import ForeignKey
+    from sqlalchemy import Integer
+    from sqlalchemy import MetaData
+    from sqlalchemy import Numeric
+    from sqlalchemy import String
+    from sqlalchemy import Table
+    from sqlalchemy import text
+
+    metadata = MetaData()
+    for index, references in enumerate(generate_foreign_keys(tables, fk_density, seed)):
+        Table(
+            _table_name(index),
+            metadata,
+            Column('id', Integer, primary_key=True),
+            Column('name', String(32), nullable=False),
+            Column('price', Numeric(precision=20, scale=10), nullable=True),
+            Column(
+                'created_at',
+                TIMESTAMP,
+                nullable=False,
+                server_default=text('CURRENT_TIMESTAMP'),
+            ),
+            *(
+                Column(
+                    f'ref_{number}_id',
+                    Integer,
+                    ForeignKey(f'{_table_name(reference)}.id'),
+                    nullable=True,
+                )
+                for number, reference in enumerate(references)
+            ),
+        )
+    return metadata
+
+
+def generate_tortoise_models(tables: int, fk_density: float, seed: int = 0) -> str:
+    """Generate module with Tortoise models equivalent to `generate_metadata` output. Returns qualified module name."""
+    from tortoise import Model  # type: ignore
+    from tortoise import fields
+
+    from testcontainers_orm.tortoise import TimestampField
+
+    module_name = (
+        f'testcontainers_orm_benchmark_models_{tables}_{int(fk_density * 100)}_{seed}'
+    )
+    module = types.ModuleType(module_name)
+    for index, references in enumerate(generate_foreign_keys(tables, fk_density, seed)):
+        name = _table_name(index)
+        attributes: Dict[str, Any] = {
+            '__module__': module_name,
+            'id': fields.IntField(pk=True),
+            'name': fields.CharField(32),
+            'price': fields.DecimalField(20, 10, null=True),
+            'created_at': TimestampField(auto_now_add=True),
+            'Meta': type('Meta', (), {'table': name}),
+        }
+        for number, reference in enumerate(references):
+            attributes[f'ref_{number}'] = fields.ForeignKeyField(
+                f'models.{_table_name(reference).title()}',
+                related_name=False,
+                null=True,
+            )
+        setattr(module, name.title(), type(name.title(), (Model,), attributes))
+    sys.modules[module_name] = module
+    return module_name
@@ -0,0 +1,436 @@
+import argparse
+import json
+import statistics
+import time
+import unittest
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import Generator
+from typing import List
+from typing import Optional
+from typing import Type
+
+from testcontainers_orm._bench_schema import generate_metadata
+from testcontainers_orm._bench_schema import generate_tortoise_models
+from testcontainers_orm.utils import classproperty
+
+# NOTE: Same as `ISOLATION_STRATEGIES` of backend modules, which are imported only when benchmark is started
+SQLALCHEMY_STRATEGIES = ('drop_create', 'truncate', 'rollback')
+TORTOISE_STRATEGIES = ('drop_create', 'truncate')
+REDIS_STRATEGIES = ('flushall', 'flushdb')
+
+
+@dataclass
+class BenchmarkResult:
+    backend: str
+    strategy: str
+    size: int
+    fk_density: float
+    iterations: int
+    # NOTE: Durations of each phase in seconds: class_setup, setup, teardown, class_teardown (seed_snapshot for Redis)
+    timings: Dict[str, List[float]] = field(default_factory=dict)
+    ddl_workers: int = 1
+
+    @property
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Min, median, mean and max of every phase in milliseconds."""
+        return {
+            phase: {
+                'min': min(durations) * 1000,
+                'median': statistics.median(durations) * 1000,
+                'mean': statistics.mean(durations) * 1000,
+                'max': max(durations) * 1000,
+            }
+            for phase, durations in self.timings.items()
+            if durations
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), 'summary': self.summary}
+
+
+class _Timings:
+    def __init__(self) -> None:
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+
+    @contextmanager
+    def measure(self, phase: str) -> Generator[None, None, None]:
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[phase].append(time.perf_counter() - start_time)
+
+
+class StandInContainer:
+    """Already running server used instead of Docker container, e.g. local MySQL or Redis instance."""
+
+    port_to_expose = None
+    # NOTE: Stand-in server is used for test cases of any image
+    image = None
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+
+    def start(self) -> 'StandInContainer':
+        return self
+
+    def stop(self) -> None:
+        pass
+
+    def get_container_host_ip(self) -> str:
+        return self.host
+
+    def get_exposed_port(self, port: Any) -> int:
+        return self.port
+
+
+def _run_iterations(case_class: Type[unittest.TestCase], iterations: int) -> None:
+    suite = unittest.TestSuite(case_class('test_seed') for _ in range(iterations))
+    result = unittest.TestResult()
+    suite.run(result)
+    problems = result.errors + result.failures
+    if problems:
+        raise RuntimeError(
+            f'Benchmark of {case_class.__name__} failed:\n{problems[0][1]}'
+        )
+
+
+def benchmark_sqlalchemy(
+    strategy: str,
+    tables: int,
+    fk_density: float,
+    iterations: int,
+    rows: int = 1,
+    stand_in: Optional[StandInContainer] = None,
+    ddl_workers: int = 1,
+) -> BenchmarkResult:
+    from testcontainers_orm.sqlalchemy import _SQLAlchemyTestCase
+
+    timings = _Timings()
+    metadata = generate_metadata(tables, fk_density)
+
+    class BenchmarkSQLAlchemyTestCase(_SQLAlchemyTestCase):
+        ISOLATION = strategy
+        DDL_WORKERS = ddl_workers
+        HOST = stand_in.host if stand_in else _SQLAlchemyTestCase.HOST
+
+        @classproperty
+        def DECLARATIVE_BASE(self) -> Type:
+            return type('BenchmarkBase', (), {'metadata': metadata})
+
+        @classmethod
+        def setUpClass(cls) -> None:
+            with timings.measure('class_setup'):
+                super().setUpClass()
+
+        @classmethod
+        def tearDownClass(cls) -> None:
+            with timings.measure('class_teardown'):
+                super().tearDownClass()
+
+        @classmethod
+        def _create_db_container(cls):
+            return stand_in or super()._create_db_container()
+
+        @classmethod
+        def _get_connection_url(cls) -> str:
+            return cls.get_config().connection_string
+
+        def setUp(self) -> None:
+            with timings.measure('setup'):
+                super().setUp()
+
+        def tearDown(self) -> None:
+            with timings.measure('teardown'):
+                super().tearDown()
+
+        def test_seed(self) -> None:
+            for table in metadata.sorted_tables:
+                values = [
+                    {'id': id_, 'name': f'{table.name}_{id_}'}
+                    for id_ in range(1, rows + 1)
+                ]
+                for column in table.foreign_keys:
+                    for value in values:
+                        value[column.parent.name] = 1
+                self.storage.execute(table.insert(), values)
+            self.storage.commit()
+
+    _start_container(BenchmarkSQLAlchemyTestCase, _SQLAlchemyTestCase)
+    _run_iterations(BenchmarkSQLAlchemyTestCase, iterations)
+    return BenchmarkResult(
+        'sqlalchemy',
+        strategy,
+        tables,
+        fk_density,
+        iterations,
+        dict(timings.durations),
+        ddl_workers,
+    )
+
+
+def benchmark_tortoise(
+    strategy: str,
+    tables: int,
+    fk_density: float,
+    iterations: int,
+    rows: int = 1,
+    stand_in: Optional[StandInContainer] = None,
+    ddl_workers: int = 1,
+) -> BenchmarkResult:
+    from tortoise import Tortoise
+
+    from testcontainers_orm.tortoise import _TortoiseTestCase
+
+    timings = _Timings()
+    models_module = generate_tortoise_models(tables, fk_density)
+
+    class BenchmarkTortoiseTestCase(_TortoiseTestCase):
+        ISOLATION = strategy
+        DDL_WORKERS = ddl_workers
+        HOST = stand_in.host if stand_in else _TortoiseTestCase.HOST
+
+        @classproperty
+        def MODELS_MODULE(self) -> str:
+            return models_module
+
+        @classmethod
+        def setUpClass(cls) -> None:
+            with timings.measure('class_setup'):
+                super().setUpClass()
+
+        @classmethod
+        def tearDownClass(cls) -> None:
+            with timings.measure('class_teardown'):
+                super().tearDownClass()
+
+        @classmethod
+        def _create_db_container(cls):
+            return stand_in or super()._create_db_container()
+
+        async def asyncSetUp(self) -> None:
+            with timings.measure('setup'):
+                await super().asyncSetUp()
+
+        async def asyncTearDown(self) -> None:
+            with timings.measure('teardown'):
+                await super().asyncTearDown()
+
+        async def test_seed(self) -> None:
+            for model in Tortoise.apps['models'].values():
+                references = {f'{name}_id': 1 for name in model._meta.fk_fields}
+                await model.bulk_create(
+                    [
+                        model(id=id_, name=f'{model.__name__}_{id_}', **references)
+                        for id_ in range(1, rows + 1)
+                    ]
+                )
+
+    _start_container(BenchmarkTortoiseTestCase, _TortoiseTestCase)
+    _run_iterations(BenchmarkTortoiseTestCase, iterations)
+    return BenchmarkResult(
+        'tortoise',
+        strategy,
+        tables,
+        fk_density,
+        iterations,
+        dict(timings.durations),
+        ddl_workers,
+    )
+
+
+def benchmark_redis(
+    strategy: str,
+    keys: int,
+    iterations: int,
+    stand_in: Optional[StandInContainer] = None,
+) -> BenchmarkResult:
+    from testcontainers_orm.redis import _RedisTestCase
+
+    timings = _Timings()
+
+    class BenchmarkRedisTestCase(_RedisTestCase):
+        ISOLATION = strategy
+        HOST = stand_in.host if stand_in else _RedisTestCase.HOST
+
+        @classmethod
+        def _create_redis_container(cls):
+            return stand_in or super()._create_redis_container()
+
+        @classmethod
+        def setUpClass(cls) -> None:
+            with timings.measure('class_setup'):
+                super().setUpClass()
+
+        @classmethod
+        def seed(cls, client: Any) -> None:
+            cls._set_keys(client, 'seed')
+
+        @classmethod
+        def snapshot_seed(cls) -> None:
+            with timings.measure('seed_snapshot'):
+                super().snapshot_seed()
+
+        @classmethod
+        def _set_keys(cls, client: Any, prefix: str) -> None:
+            pipeline = client.pipeline(transaction=False)
+            for index in range(keys):
+                pipeline.set(f'benchmark:{prefix}:{index}', index)
+            pipeline.execute()
+
+        # NOTE: Seed snapshot is restored in `setUp`
+        def setUp(self) -> None:
+            with timings.measure('setup'):
+                super().setUp()
+
+        def tearDown(self) -> None:
+            with timings.measure('teardown'):
+                super().tearDown()
+
+        def test_seed(self) -> None:
+            self._set_keys(self.get_client(), 'test')
+
+    BenchmarkRedisTestCase.start_redis_container()
+    _run_iterations(BenchmarkRedisTestCase, iterations)
+    return BenchmarkResult(
+        'redis', strategy, keys, 0.0, iterations, dict(timings.durations)
+    )
+
+
+def _start_container(
+    case_class: Type[unittest.TestCase], base_class: Type[unittest.TestCase]
+) -> None:
+    """Start database container in advance so its startup time doesn't affect `class_setup` timings."""
+    super(base_class, case_class).setUpClass()  # type: ignore
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m testcontainers_orm.benchmark',
+        description='Measure setup and teardown latency of test isolation strategies. Results are printed as JSON.',
+    )
+    parser.add_argument(
+        '--backend',
+        nargs='+',
+        choices=('sqlalchemy', 'tortoise', 'redis'),
+        default=['sqlalchemy'],
+    )
+    for backend, strategies in (
+        ('sqlalchemy', SQLALCHEMY_STRATEGIES),
+        ('tortoise', TORTOISE_STRATEGIES),
+        ('redis', REDIS_STRATEGIES),
+    ):
+        parser.add_argument(
+            f'--{backend}-strategy',
+            nargs='+',
+            choices=strategies,
+            default=list(strategies),
+            help=f'{backend.title()} strategies to measure, all by default',
+        )
+    parser.add_argument(
+        '--tables',
+        nargs='+',
+        type=int,
+        default=[10, 100],
+        help='Number of tables in generated schema',
+    )
+    parser.add_argument(
+        '--fk-density',
+        type=float,
+        default=0.3,
+        help='Average number of foreign keys per table',
+    )
+    parser.add_argument(
+        '--rows',
+        type=int,
+        default=1,
+        help='Rows inserted into every table in each test',
+    )
+    parser.add_argument(
+        '--keys',
+        nargs='+',
+        type=int,
+        default=[1000, 100000],
+        help='Number of Redis keys set in each test',
+    )
+    parser.add_argument(
+        '--ddl-workers',
+        nargs='+',
+        type=int,
+        default=[1],
+        help='Connections used to create and drop tables',
+    )
+    parser.add_argument('--iterations', type=int, default=5)
+    parser.add_argument(
+        '--mysql',
+        metavar='HOST:PORT',
+        help='Use running MySQL server instead of a container',
+    )
+    parser.add_argument(
+        '--redis',
+        metavar='HOST:PORT',
+        help='Use running Redis server instead of a container',
+    )
+    parser.add_argument('--output', help='Write results to file instead of stdout')
+    args = parser.parse_args(argv)
+
+    mysql_stand_in = _parse_stand_in(args.mysql)
+    redis_stand_in = _parse_stand_in(args.redis)
+
+    results = []
+    for backend in args.backend:
+        if backend == 'redis':
+            for strategy in args.redis_strategy:
+                for keys in args.keys:
+                    results.append(
+                        benchmark_redis(strategy, keys, args.iterations, redis_stand_in)
+                    )
+            continue
+
+        benchmark = (
+            benchmark_sqlalchemy if backend == 'sqlalchemy' else benchmark_tortoise
+        )
+        strategies = (
+            args.sqlalchemy_strategy
+            if backend == 'sqlalchemy'
+            else args.tortoise_strategy
+        )
+        for strategy in strategies:
+            for tables in args.tables:
+                for ddl_workers in args.ddl_workers:
+                    results.append(
+                        benchmark(
+                            strategy,
+                            tables,
+                            args.fk_density,
+                            args.iterations,
+                            args.rows,
+                            mysql_stand_in,
+                            ddl_workers,
+                        )
+                    )
+
+    output = json.dumps([result.as_dict() for result in results], indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(output)
+    else:
+        print(output)
+
+
+def _parse_stand_in(address: Optional[str]) -> Optional[StandInContainer]:
+    if not address:
+        return None
+    host, port = address.rsplit(':', 1)
+    return StandInContainer(host, int(port))
+
+
+if __name__ == '__main__':
+    main()
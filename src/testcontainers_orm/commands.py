@@ -0,0 +1,142 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+
+from testcontainers_orm.queries import _wrap_test_method
+
+# NOTE: Logs of all active captures, connection methods are patched while there is at least one
+_active_logs: List['CommandLog'] = []
+_originals: Optional[tuple] = None  # pylint: disable=unsubscriptable-object
+# NOTE: Methods are replaced with `setattr`, type stubs of redis don't allow assigning to methods
+_PATCHED_METHODS = ('pack_command', 'pack_commands', 'send_packed_command')
+
+
+@dataclass
+class CommandStats:
+    commands: int = 0
+    round_trips: int = 0
+    pipelines: int = 0
+    max_pipeline_size: int = 0
+    bytes_sent: int = 0
+
+
+class CommandLog:
+    """Redis commands sent by any client while capture was active.
+
+    Every packet sent to the server is a round trip: a single command or a whole pipeline.
+    """
+
+    def __init__(self) -> None:
+        self.commands: List[str] = []
+        self.pipeline_sizes: List[int] = []
+        self.round_trips = 0
+        self.bytes_sent = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.commands)
+
+    @property
+    def stats(self) -> CommandStats:
+        return CommandStats(
+            commands=self.count,
+            round_trips=self.round_trips,
+            pipelines=len(self.pipeline_sizes),
+            max_pipeline_size=max(self.pipeline_sizes, default=0),
+            bytes_sent=self.bytes_sent,
+        )
+
+    def format(self) -> str:
+        lines = [
+            f'{count:>5} x {command}'
+            for command, count in Counter(self.commands).most_common()
+        ]
+        lines.append(
+            f'{self.round_trips} round trips, {len(self.pipeline_sizes)} pipelines, {self.bytes_sent} bytes sent'
+        )
+        return '\n'.join(lines)
+
+
+def _get_command_name(args: tuple) -> str:
+    name = args[0]
+    if isinstance(name, bytes):
+        name = name.decode()
+    # NOTE: Subcommands may be passed as a part of command name, e.g. 'CONFIG GET'
+    return str(name).split(' ', 1)[0].upper()
+
+
+def _patch_connection() -> None:
+    global _originals
+    from redis.connection import Connection  # type: ignore
+
+    pack_command, pack_commands, send_packed_command = (
+        getattr(Connection, name) for name in _PATCHED_METHODS
+    )
+
+    def pack_command_wrapper(self: Any, *args: Any) -> Any:
+        command = _get_command_name(args)
+        for log in _active_logs:
+            log.commands.append(command)
+        return pack_command(self, *args)
+
+    def pack_commands_wrapper(self: Any, commands: Any) -> Any:
+        commands = list(commands)
+        for log in _active_logs:
+            log.pipeline_sizes.append(len(commands))
+        return pack_commands(self, commands)
+
+    def send_packed_command_wrapper(
+        self: Any, command: Any, check_health: bool = True
+    ) -> Any:
+        size = (
+            len(command)
+            if isinstance(command, (str, bytes))
+            else sum(len(item) for item in command)
+        )
+        for log in _active_logs:
+            log.round_trips += 1
+            log.bytes_sent += size
+        return send_packed_command(self, command, check_health)
+
+    _originals = (pack_command, pack_commands, send_packed_command)
+    for name, wrapper in zip(
+        _PATCHED_METHODS,
+        (pack_command_wrapper, pack_commands_wrapper, send_packed_command_wrapper),
+    ):
+        setattr(Connection, name, wrapper)
+
+
+def _unpatch_connection() -> None:
+    global _originals
+    from redis.connection import Connection  # type: ignore
+
+    if _originals is None:
+        return
+    for name, original in zip(_PATCHED_METHODS, _originals):
+        setattr(Connection, name, original)
+    _originals = None
+
+
+def start_capture(log: CommandLog) -> None:
+    if not _active_logs:
+        _patch_connection()
+    _active_logs.append(log)
+
+
+def stop_capture(log: CommandLog) -> None:
+    _active_logs.remove(log)
+    if not _active_logs:
+        _unpatch_connection()
+
+
+def max_round_trips(count: int) -> Callable[[Callable], Callable]:
+    """Decorator for test methods, same as wrapping the whole method body in `self.assertMaxRoundTrips(count)`."""
+    return lambda func: _wrap_test_method(func, 'assertMaxRoundTrips', count)
+
+
+def max_commands(count: int) -> Callable[[Callable], Callable]:
+    """Decorator for test methods, same as wrapping the whole method body in `self.assertMaxCommands(count)`."""
+    return lambda func: _wrap_test_method(func, 'assertMaxCommands', count)
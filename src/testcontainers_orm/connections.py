@@ -0,0 +1,66 @@
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+
+
+@dataclass
+class PoolStats:
+    checkouts: int = 0
+    checkins: int = 0
+    peak_checked_out: int = 0
+    # NOTE: Time spent acquiring connections in seconds. SQLAlchemy pools report only time spent establishing new ones.
+    wait_time: float = 0.0
+    leaked_connections: int = 0
+    open_transactions: int = 0
+
+
+class PoolMonitor:
+    """Base class for connection pool instrumentation.
+
+    Subclasses hook into pool implementation in `start` and report events with `checkout` and `checkin` methods.
+    """
+
+    def __init__(self) -> None:
+        self.stats = PoolStats()
+        self.checked_out: Dict[int, Any] = {}
+
+    @abstractmethod
+    def start(self) -> None:
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        pass
+
+    def checkout(self, key: int, connection: Any, wait_time: float) -> None:
+        self.checked_out[key] = connection
+        self.stats.checkouts += 1
+        self.stats.wait_time += wait_time
+        self.stats.peak_checked_out = max(
+            self.stats.peak_checked_out, len(self.checked_out)
+        )
+
+    def checkin(self, key: int) -> None:
+        if self.checked_out.pop(key, None) is not None:
+            self.stats.checkins += 1
+
+    def release_leaked_connections(self) -> int:
+        """Forcibly release connections which are still checked out, so they don't hold locks. Returns number of leaks."""
+        leaked = list(self.checked_out.items())
+        self.stats.leaked_connections += len(leaked)
+        self.stats.open_transactions += sum(
+            1 for key, connection in leaked if self._in_transaction(key, connection)
+        )
+        self.checked_out.clear()
+        for _, connection in leaked:
+            self._release(connection)
+        return len(leaked)
+
+    @abstractmethod
+    def _in_transaction(self, key: int, connection: Any) -> bool:
+        pass
+
+    @abstractmethod
+    def _release(self, connection: Any) -> None:
+        pass
@@ -1,16 +1,51 @@
 import atexit
 import unittest
 from abc import abstractmethod
+from contextlib import contextmanager
+from dataclasses import asdict
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ContextManager
+from typing import Generator
 from typing import Optional
 
-from testcontainers.core.generic import DbContainer  # type: ignore
-from testcontainers.mysql import MySqlContainer  # type: ignore
-
 from testcontainers_orm.config import DatabaseConfig
+from testcontainers_orm.digests import StatementDigestLog
+from testcontainers_orm.digests import take_digest_snapshot
+from testcontainers_orm.fingerprint import drop_all_tables
+from testcontainers_orm.fingerprint import read_fingerprint
+from testcontainers_orm.queries import QueryLog
+from testcontainers_orm.report import report
+from testcontainers_orm.sharding import get_container_name
+from testcontainers_orm.sharding import get_resource_limits
+from testcontainers_orm.sharding import get_run_id
+from testcontainers_orm.sharding import get_shard
+from testcontainers_orm.sharding import get_shard_count
+from testcontainers_orm.sharding import get_worker_database
+from testcontainers_orm.sharding import get_worker_id
+from testcontainers_orm.sharding import is_sharded
+from testcontainers_orm.sharding import start_shared_container
+
+# NOTE: testcontainers imports Docker SDK and SQLAlchemy, so it's imported only when container is about to be created.
+if TYPE_CHECKING:
+    from testcontainers.core.generic import DbContainer  # type: ignore
+    from testcontainers.mysql import MySqlContainer  # type: ignore
 
 # NOTE: Container object is a singleton which will be used in all tests inherited from DatabaseTestCase and stopped after
 # NOTE: all tests are completed.
-db_container: Optional[DbContainer] = None  # pylint: disable=unsubscriptable-object
+db_container: Optional['DbContainer'] = None  # pylint: disable=unsubscriptable-object
+
+
+def stop_db_container(
+    image: Optional[str] = None,
+) -> None:  # pylint: disable=unsubscriptable-object
+    """Stop running database container (only if it runs a given image). The next test case starts a new one."""
+    global db_container
+    if db_container is None or (image and db_container.image != image):
+        return
+    atexit.unregister(db_container.stop)
+    db_container.stop()
+    db_container = None
 
 
 class _DatabaseTestCase(unittest.TestCase):
@@ -22,9 +57,12 @@ class _DatabaseTestCase(unittest.TestCase):
     PASSWORD = 'test'
     DATABASE = 'test'
 
+    # Docker image of database container. Running container is replaced if test case requires another image.
+    IMAGE: Optional[str] = None  # pylint: disable=unsubscriptable-object
+
     @classmethod
     @abstractmethod
-    def _create_db_container(cls) -> DbContainer:
+    def _create_db_container(cls) -> 'DbContainer':
         pass
 
     @classmethod
@@ -39,11 +77,44 @@ class _DatabaseTestCase(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls) -> None:
+        cls.start_db_container()
+
+    @classmethod
+    def start_db_container(cls) -> 'DbContainer':
+        """Start database container unless it's already running. Container is stopped when interpreter exits."""
         global db_container
+        # NOTE: Run test cases grouped by image (see `testcontainers_orm.scheduling`) to avoid restarting containers
+        if (
+            db_container
+            and db_container.image
+            and cls.IMAGE
+            and db_container.image != cls.IMAGE
+        ):
+            stop_db_container()
         if not db_container:
-            db_container = cls._create_db_container()
-            db_container.start()
+            if is_sharded():
+                db_container = cls._start_shared_db_container(
+                    cls._create_db_container()
+                )
+            else:
+                db_container = cls._create_db_container()
+                db_container.start()
             atexit.register(db_container.stop)
+        return db_container
+
+    @classmethod
+    def _start_shared_db_container(cls, container: 'DbContainer') -> 'DbContainer':
+        """Start one of `TESTCONTAINERS_ORM_SHARDS` containers shared by workers assigned to it by consistent hashing."""
+        shards = get_shard_count()
+        shard = get_shard(get_worker_id(), shards)
+        container.with_kwargs(**get_resource_limits(shards))
+        return start_shared_container(
+            container, get_container_name(container.image, get_run_id() or '', shard)
+        )
+
+    def run(self, result=None):
+        with report.measure_duration(self.id()):
+            return super().run(result)
 
     @classmethod
     def get_config(cls) -> DatabaseConfig:
@@ -53,15 +124,140 @@ class _DatabaseTestCase(unittest.TestCase):
             port=cls._get_port(),
             user=cls.USER,
             password=cls.PASSWORD,
-            database=cls.DATABASE,
+            database=get_worker_database(cls.DATABASE),
         )
 
+    @classmethod
+    @abstractmethod
+    def capture_queries(cls) -> ContextManager[QueryLog]:
+        """Record every statement sent to the database inside the block."""
+
+    @contextmanager
+    def assertMaxQueries(self, count: int) -> Generator[QueryLog, None, None]:
+        with self.capture_queries() as queries:
+            yield queries
+        if queries.count > count:
+            self.fail(
+                f'{queries.count} queries executed, expected at most {count}:\n{queries.format()}'
+            )
+
+    @contextmanager
+    def assertQueryTimeUnder(self, ms: float) -> Generator[QueryLog, None, None]:
+        with self.capture_queries() as queries:
+            yield queries
+        total_ms = queries.total_time * 1000
+        if total_ms >= ms:
+            self.fail(
+                f'Queries took {total_ms:.2f} ms, expected less than {ms} ms:\n{queries.format()}'
+            )
+
 
 class _MySQLDatabaseTestCase(_DatabaseTestCase):
     IMAGE = 'mysql/mysql-server:8.0'
 
+    # Read performance_schema statement digests before and after each test and add the difference to the report
+    CAPTURE_STATEMENT_DIGESTS = False
+
+    # Internal attributes for typehinting
+    statement_digests: Optional[StatementDigestLog] = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._drop_stale_schema()
+
     @classmethod
-    def _create_db_container(cls) -> MySqlContainer:
+    def start_db_container(cls) -> 'DbContainer':
+        container = super().start_db_container()
+        # NOTE: Only default database is created on container start, workers sharing container use their own ones
+        if is_sharded():
+            with cls._connect() as connection:
+                connection.cursor().execute(
+                    f'CREATE DATABASE IF NOT EXISTS `{cls.get_config().database}`'
+                )
+        return container
+
+    @classmethod
+    def get_schema_fingerprint(cls) -> Optional[str]:
+        """Fingerprint of schema built by test case, used to reuse tables left by previous ones. `None` if unknown."""
+        return None
+
+    @classmethod
+    def _drop_stale_schema(cls) -> None:
+        """Drop tables left by previous test cases unless they were built from the same schema."""
+        database = cls.get_config().database
+        with cls._connect() as connection:
+            fingerprint = read_fingerprint(connection, database)
+            if fingerprint is not None and fingerprint != cls.get_schema_fingerprint():
+                drop_all_tables(connection, database)
+
+    @classmethod
+    @contextmanager
+    def _connect(cls) -> Generator[Any, None, None]:
+        """Plain DB-API connection to the server without default database."""
+        import pymysql  # type: ignore
+
+        config = cls.get_config()
+        connection = pymysql.connect(
+            host=config.host,
+            port=config.port,
+            user=config.user,
+            password=config.password,
+            autocommit=True,
+        )
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    def run(self, result=None):
+        if not self.CAPTURE_STATEMENT_DIGESTS:
+            return super().run(result)
+
+        with self.capture_statement_digests() as digests:
+            result = super().run(result)
+
+        self.statement_digests = digests
+        report.add(
+            self.id(),
+            'statement_digests',
+            [asdict(digest) for digest in digests.digests],
+        )
+        return result
+
+    @classmethod
+    @contextmanager
+    def capture_statement_digests(cls) -> Generator[StatementDigestLog, None, None]:
+        """Collect server-side statistics of statements executed in test database inside the block.
+
+        NOTE: Digests are aggregated server-wide, so statements of concurrent clients of the same schema are included too.
+        """
+        database = cls.get_config().database
+        with cls._connect() as connection:
+            digests = StatementDigestLog()
+            before = take_digest_snapshot(connection, database)
+            yield digests
+            after = take_digest_snapshot(connection, database)
+            digests.digests = StatementDigestLog.from_snapshots(before, after).digests
+
+    @contextmanager
+    def assertNoFullTableScans(self) -> Generator[StatementDigestLog, None, None]:
+        """Fail if a SELECT, INSERT, UPDATE, DELETE or REPLACE statement executed in the block didn't use an index.
+
+        Other statements (`SHOW`, `SET`, reads of system variables) are ignored, e.g. ones dialects execute on first connect.
+        """
+        with self.capture_statement_digests() as digests:
+            yield digests
+        full_table_scans = digests.full_table_scans
+        if full_table_scans:
+            self.fail(
+                f'{len(full_table_scans)} statements used full table scan:\n{digests.format(full_table_scans)}'
+            )
+
+    @classmethod
+    def _create_db_container(cls) -> 'MySqlContainer':
+        from testcontainers.mysql import MySqlContainer  # type: ignore
+
         return MySqlContainer(
             cls.IMAGE,
             MYSQL_USER=cls.USER,
@@ -72,6 +268,9 @@ class _MySQLDatabaseTestCase(_DatabaseTestCase):
     def _get_connection_url(cls) -> str:
         if db_container is None:
             raise RuntimeError('Database container is not running')
+        # NOTE: Shared container is attached to, so URL is built from config with the worker's database
+        if is_sharded():
+            return cls.get_config().connection_string
         return db_container.get_connection_url()
 
     @classmethod
@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Sequence
+from typing import TypeVar
+
+T = TypeVar('T')
+
+
+def topological_levels(
+    items: Sequence[T],
+    get_name: Callable[[T], str],
+    get_references: Callable[[T], Iterable[str]],
+) -> List[List[T]]:
+    """Split tables into levels, so every table only references tables of previous levels.
+
+    Tables of the same level don't depend on each other and can be created (or dropped, in reverse order) concurrently.
+    Self-references and references to tables not in `items` are ignored.
+    """
+    names = {get_name(item) for item in items}
+    levels: Dict[str, int] = {}
+    pending = list(items)
+    while pending:
+        remaining = []
+        for item in pending:
+            name = get_name(item)
+            references = {
+                reference
+                for reference in get_references(item)
+                if reference in names and reference != name
+            }
+            if references.issubset(levels):
+                levels[name] = max(
+                    (levels[reference] + 1 for reference in references), default=0
+                )
+            else:
+                remaining.append(item)
+        if len(remaining) == len(pending):
+            raise ValueError(
+                f'Cyclic foreign key references between tables: {", ".join(sorted(map(get_name, remaining)))}'
+            )
+        pending = remaining
+
+    result: List[List[T]] = [[] for _ in range(max(levels.values(), default=-1) + 1)]
+    for item in items:
+        result[levels[get_name(item)]].append(item)
+    return result
+
+
+def run_in_levels(
+    levels: List[List[T]], func: Callable[[T], None], workers: int
+) -> None:
+    """Call `func` for items of each level concurrently in threads, waiting for a level to complete before the next one."""
+    with ThreadPoolExecutor(workers) as executor:
+        for level in levels:
+            # NOTE: Consume results to raise the first exception
+            list(executor.map(func, level))
@@ -0,0 +1,143 @@
+from dataclasses import dataclass
+from dataclasses import replace
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+DIGESTS_QUERY = '''
+SELECT
+    SCHEMA_NAME,
+    DIGEST,
+    DIGEST_TEXT,
+    COUNT_STAR,
+    SUM_TIMER_WAIT,
+    SUM_ROWS_EXAMINED,
+    SUM_ROWS_SENT,
+    SUM_CREATED_TMP_TABLES,
+    SUM_CREATED_TMP_DISK_TABLES,
+    SUM_NO_INDEX_USED,
+    SUM_NO_GOOD_INDEX_USED,
+    SUM_SELECT_SCAN
+FROM performance_schema.events_statements_summary_by_digest
+WHERE SCHEMA_NAME = %s
+'''
+
+# NOTE: Timers in performance_schema are in picoseconds
+PICOSECONDS = 10 ** 12
+
+# NOTE: Leading keywords of statements checked for full table scans
+DML_KEYWORDS = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE')
+
+
+@dataclass
+class StatementDigest:
+    schema: str
+    digest: str
+    digest_text: str
+    count: int = 0
+    latency: float = 0.0
+    rows_examined: int = 0
+    rows_sent: int = 0
+    tmp_tables: int = 0
+    tmp_disk_tables: int = 0
+    no_index_used: int = 0
+    no_good_index_used: int = 0
+    select_scan: int = 0
+
+    @classmethod
+    def from_row(cls, row: Tuple[Any, ...]) -> 'StatementDigest':
+        schema, digest, digest_text, count, timer_wait, *counters = row
+        return cls(
+            schema,
+            digest,
+            digest_text,
+            int(count),
+            int(timer_wait) / PICOSECONDS,
+            *(int(counter) for counter in counters),
+        )
+
+    @property
+    def full_table_scan(self) -> bool:
+        return bool(self.no_index_used or self.select_scan)
+
+    @property
+    def is_dml(self) -> bool:
+        """Data manipulation statement. Reads of system variables and performance_schema (e.g. by digest snapshots) are excluded."""
+        text = self.digest_text.lstrip().upper()
+        return (
+            text.startswith(DML_KEYWORDS)
+            and not text.startswith('SELECT @@')
+            and 'PERFORMANCE_SCHEMA' not in text
+        )
+
+    def __sub__(self, other: 'StatementDigest') -> 'StatementDigest':
+        return replace(
+            self,
+            count=self.count - other.count,
+            latency=self.latency - other.latency,
+            rows_examined=self.rows_examined - other.rows_examined,
+            rows_sent=self.rows_sent - other.rows_sent,
+            tmp_tables=self.tmp_tables - other.tmp_tables,
+            tmp_disk_tables=self.tmp_disk_tables - other.tmp_disk_tables,
+            no_index_used=self.no_index_used - other.no_index_used,
+            no_good_index_used=self.no_good_index_used - other.no_good_index_used,
+            select_scan=self.select_scan - other.select_scan,
+        )
+
+
+DigestSnapshot = Dict[Tuple[str, str], StatementDigest]
+
+
+def take_digest_snapshot(connection, schema: str) -> DigestSnapshot:
+    """Read current statement digest counters of a given schema using DB-API connection."""
+    with connection.cursor() as cursor:
+        cursor.execute(DIGESTS_QUERY, (schema,))
+        digests = [StatementDigest.from_row(row) for row in cursor.fetchall()]
+    return {(digest.schema, digest.digest): digest for digest in digests}
+
+
+class StatementDigestLog:
+    """Statement digests accumulated between two snapshots."""
+
+    def __init__(self, digests: Optional[List[StatementDigest]] = None) -> None:
+        self.digests: List[StatementDigest] = digests or []
+
+    @classmethod
+    def from_snapshots(
+        cls, before: DigestSnapshot, after: DigestSnapshot
+    ) -> 'StatementDigestLog':
+        digests = []
+        for key, digest in after.items():
+            if key in before:
+                digest = digest - before[key]
+            if digest.count > 0:
+                digests.append(digest)
+        return cls(digests)
+
+    @property
+    def full_table_scans(self) -> List[StatementDigest]:
+        """DML statements which used full table scan.
+
+        Statements executed by drivers on connect (`SHOW VARIABLES`, `SET NAMES`, `SELECT @@tx_isolation`) are ignored.
+        """
+        return [
+            digest
+            for digest in self.digests
+            if digest.is_dml and digest.full_table_scan
+        ]
+
+    def format(self, digests: Optional[List[StatementDigest]] = None) -> str:
+        lines = []
+        for digest in sorted(
+            self.digests if digests is None else digests,
+            key=lambda d: d.latency,
+            reverse=True,
+        ):
+            lines.append(
+                f'{digest.count:>5} x {digest.latency * 1000:>10.2f} ms  '
+                f'examined={digest.rows_examined} sent={digest.rows_sent} tmp={digest.tmp_tables} '
+                f'no_index={digest.no_index_used}  {digest.digest_text}'
+            )
+        return '\n'.join(lines)
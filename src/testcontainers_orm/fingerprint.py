@@ -0,0 +1,81 @@
+import hashlib
+import os
+from typing import Iterable
+from typing import Optional
+
+# NOTE: Marker table is created in every database built by test cases. Tables of a database are reused by the next
+# NOTE: test case only if fingerprint of its schema matches the one stored in marker table.
+FINGERPRINT_TABLE = '_schema_fingerprint'
+
+
+def hash_strings(strings: Iterable[str]) -> str:
+    digest = hashlib.sha256()
+    for string in strings:
+        digest.update(string.encode())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def files_fingerprint(paths: Iterable[str]) -> str:
+    """Fingerprint of file contents, directories are traversed recursively."""
+
+    def read_files() -> Iterable[str]:
+        for path in paths:
+            if os.path.isfile(path):
+                filenames = [path]
+            else:
+                filenames = sorted(
+                    os.path.join(root, filename)
+                    for root, dirs, files in os.walk(path)
+                    if '__pycache__' not in root
+                    for filename in files
+                )
+            for filename in filenames:
+                with open(filename, 'rb') as file:
+                    yield os.path.relpath(
+                        filename, path
+                    ) if filename != path else os.path.basename(path)
+                    yield file.read().decode(errors='replace')
+
+    return hash_strings(read_files())
+
+
+def read_fingerprint(connection, database: str) -> Optional[str]:
+    """Read fingerprint stored in a given database using DB-API connection. Returns `None` if there's no marker."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = %s AND table_name = %s',
+            (database, FINGERPRINT_TABLE),
+        )
+        if not cursor.fetchone()[0]:
+            return None
+        cursor.execute(f'SELECT fingerprint FROM `{database}`.`{FINGERPRINT_TABLE}`')
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+
+def write_fingerprint(connection, database: str, fingerprint: str) -> None:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TABLE IF NOT EXISTS `{database}`.`{FINGERPRINT_TABLE}` (fingerprint CHAR(64) NOT NULL)'
+        )
+        cursor.execute(f'DELETE FROM `{database}`.`{FINGERPRINT_TABLE}`')
+        cursor.execute(
+            f'INSERT INTO `{database}`.`{FINGERPRINT_TABLE}` (fingerprint) VALUES (%s)',
+            (fingerprint,),
+        )
+
+
+def drop_all_tables(connection, database: str) -> None:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT table_name FROM information_schema.tables WHERE table_schema = %s AND table_type = %s',
+            (database, 'BASE TABLE'),
+        )
+        tables = [row[0] for row in cursor.fetchall()]
+        cursor.execute('SET FOREIGN_KEY_CHECKS = 0')
+        try:
+            for table in tables:
+                cursor.execute(f'DROP TABLE IF EXISTS `{database}`.`{table}`')
+        finally:
+            cursor.execute('SET FOREIGN_KEY_CHECKS = 1')
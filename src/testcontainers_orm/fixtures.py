@@ -0,0 +1,91 @@
+import csv
+import json
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+# NOTE: Number of rows sent to the server in a single `executemany` call
+CHUNK_SIZE = 1000
+
+# NOTE: Same NULL marker as in `SELECT ... INTO OUTFILE`
+CSV_NULL = '\\N'
+
+Row = Dict[str, Any]
+
+
+@dataclass
+class Fixture:
+    """Rows loaded into a table once per test case class. All rows of a fixture must have the same set of columns."""
+
+    table: str
+    # NOTE: Called without arguments. `...` keeps mypy from treating the field as a method taking `self`.
+    factory: Callable[..., Iterable[Row]]
+
+    @classmethod
+    def from_rows(cls, table: str, rows: Iterable[Row]) -> 'Fixture':
+        rows = list(rows)
+        return cls(table, lambda: rows)
+
+    @classmethod
+    def from_csv(cls, table: str, path: str) -> 'Fixture':
+        """CSV file with header row. `\\N` values are loaded as NULL."""
+
+        def read_csv() -> Iterator[Row]:
+            with open(path, newline='') as file:
+                for row in csv.DictReader(file):
+                    yield {
+                        column: None if value == CSV_NULL else value
+                        for column, value in row.items()
+                    }
+
+        return cls(table, read_csv)
+
+    @classmethod
+    def from_json(cls, path: str) -> List['Fixture']:
+        """JSON file with an object mapping table names to lists of rows."""
+        with open(path) as file:
+            tables = json.load(file)
+        return [cls.from_rows(table, rows) for table, rows in tables.items()]
+
+    def chunks(
+        self, size: int = CHUNK_SIZE
+    ) -> Iterator[Tuple[str, List[Tuple[Any, ...]]]]:
+        """Yield INSERT statement with lists of parameters for `executemany` calls, reading rows lazily."""
+        rows = iter(self.factory())
+        columns: List[str] = []
+        while True:
+            chunk = list(islice(rows, size))
+            if not chunk:
+                return
+            if not columns:
+                columns = list(chunk[0])
+            yield insert_statement(self.table, columns), [
+                tuple(row[column] for column in columns) for row in chunk
+            ]
+
+
+def insert_statement(table: str, columns: List[str]) -> str:
+    column_names = ', '.join(f'`{column}`' for column in columns)
+    placeholders = ', '.join('%s' for _ in columns)
+    return f'INSERT INTO `{table}` ({column_names}) VALUES ({placeholders})'
+
+
+def snapshot_statements(database: str, snapshot_database: str, table: str) -> List[str]:
+    """Copy table with data to snapshot database on the server side."""
+    return [
+        f'CREATE TABLE `{snapshot_database}`.`{table}` LIKE `{database}`.`{table}`',
+        f'INSERT INTO `{snapshot_database}`.`{table}` SELECT * FROM `{database}`.`{table}`',
+    ]
+
+
+def restore_statements(database: str, snapshot_database: str, table: str) -> List[str]:
+    """Copy data of empty table from snapshot database on the server side."""
+    return [
+        f'INSERT INTO `{database}`.`{table}` SELECT * FROM `{snapshot_database}`.`{table}`'
+    ]
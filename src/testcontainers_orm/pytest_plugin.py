@@ -0,0 +1,165 @@
+import unittest
+from dataclasses import asdict
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generator
+from typing import Type
+
+import pytest  # type: ignore
+
+from testcontainers_orm.config import DatabaseConfig
+from testcontainers_orm.report import report
+
+# NOTE: Fixtures use the same containers, schemas and isolation strategies as unittest base classes. Containers are
+# NOTE: started lazily by session-scoped fixtures, so tests which don't request them never start Docker. Override
+# NOTE: `sqlalchemy_test_case`, `alembic_test_case` and `redis_test_case` fixtures in conftest to return a subclass of
+# NOTE: corresponding base class, e.g. to set `DECLARATIVE_BASE`, `IMAGE`, `ISOLATION` or `FIXTURES`.
+# NOTE: Fixtures with generic names are prefixed with `testcontainers_` to avoid clashes with other plugins.
+
+# NOTE: ORM modules are imported inside fixtures, so loading the plugin doesn't slow down collection
+if TYPE_CHECKING:
+    from redis import Redis  # type: ignore
+    from sqlalchemy.engine import Connection  # type: ignore
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.orm import Session
+
+    from testcontainers_orm.redis import _RedisTestCase
+    from testcontainers_orm.sqlalchemy import _SQLAlchemyAlembicTestCase
+    from testcontainers_orm.sqlalchemy import _SQLAlchemyTestCase
+
+
+@pytest.fixture(scope='session')
+def sqlalchemy_test_case() -> Type['_SQLAlchemyTestCase']:
+    """Test case class used as a configuration of SQLAlchemy fixtures."""
+    from testcontainers_orm.sqlalchemy import _SQLAlchemyTestCase
+
+    return _SQLAlchemyTestCase
+
+
+@pytest.fixture(scope='session')
+def alembic_test_case() -> Type['_SQLAlchemyAlembicTestCase']:
+    """Test case class used by `alembic_comparison` fixture, must be overridden."""
+    raise NotImplementedError(
+        'Override `alembic_test_case` fixture to return subclass of _SQLAlchemyAlembicTestCase'
+    )
+
+
+@pytest.fixture(scope='session')
+def redis_test_case() -> Type['_RedisTestCase']:
+    """Test case class used as a configuration of Redis fixtures."""
+    from testcontainers_orm.redis import _RedisTestCase
+
+    return _RedisTestCase
+
+
+@pytest.fixture(scope='session')
+def testcontainers_mysql_container(
+    sqlalchemy_test_case: Type['_SQLAlchemyTestCase'],
+) -> Any:
+    return sqlalchemy_test_case.start_db_container()
+
+
+@pytest.fixture(scope='session')
+def testcontainers_sqlalchemy_config(
+    sqlalchemy_test_case: Type['_SQLAlchemyTestCase'],
+    testcontainers_mysql_container: Any,
+) -> DatabaseConfig:
+    return sqlalchemy_test_case.get_config()
+
+
+@pytest.fixture(scope='session')
+def testcontainers_sqlalchemy_engine(
+    sqlalchemy_test_case: Type['_SQLAlchemyTestCase'],
+    testcontainers_mysql_container: Any,
+) -> Generator['Engine', None, None]:
+    engine = sqlalchemy_test_case._get_engine()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope='session')
+def testcontainers_sqlalchemy_schema(
+    sqlalchemy_test_case: Type['_SQLAlchemyTestCase'],
+    testcontainers_mysql_container: Any,
+) -> Generator[None, None, None]:
+    """Drop stale tables, build schema and load fixtures once per session, same as `setUpClass` does."""
+    sqlalchemy_test_case.setUpClass()
+    yield
+    sqlalchemy_test_case.tearDownClass()
+
+
+@pytest.fixture
+def _sqlalchemy_isolation(
+    request: Any,
+    sqlalchemy_test_case: Type['_SQLAlchemyTestCase'],
+    testcontainers_sqlalchemy_schema: None,
+) -> Generator['_SQLAlchemyTestCase', None, None]:
+    """Test case instance isolating a test with its own `setUp` and `tearDown`, including leak checks."""
+    # NOTE: Default `runTest` method of unittest is replaced with the test function, so `required_tables` are applied
+    test = sqlalchemy_test_case()
+    setattr(test, 'runTest', request.function)
+    with test.monitor_pool():
+        test.setUp()
+        try:
+            yield test
+        finally:
+            test.tearDown()
+    report.add(request.node.nodeid, 'pool', asdict(test.pool_stats))
+
+
+@pytest.fixture
+def testcontainers_sqlalchemy_session(
+    _sqlalchemy_isolation: '_SQLAlchemyTestCase',
+) -> Generator['Session', None, None]:
+    """Session of `STORAGE_CLASS`, same as `self.storage` of `_SQLAlchemyTestCase`."""
+    test = _sqlalchemy_isolation
+    # NOTE: With 'rollback' isolation `setUp` creates session bound to the isolation connection
+    if test.ISOLATION == 'rollback':
+        yield test.storage
+        return
+
+    with test.create_storage() as session:
+        yield session
+
+
+@pytest.fixture
+def testcontainers_sqlalchemy_connection(
+    _sqlalchemy_isolation: '_SQLAlchemyTestCase',
+) -> Generator['Connection', None, None]:
+    with _sqlalchemy_isolation.get_connection() as connection:
+        yield connection
+
+
+@pytest.fixture(scope='module')
+def alembic_comparison(
+    alembic_test_case: Type['_SQLAlchemyAlembicTestCase'],
+) -> unittest.TestResult:
+    """Result of all checks of `_SQLAlchemyAlembicTestCase` comparing models with migrations.
+
+    Usage: `assert alembic_comparison.wasSuccessful(), alembic_comparison.failures`
+    """
+    result = unittest.TestResult()
+    unittest.TestLoader().loadTestsFromTestCase(alembic_test_case).run(result)
+    return result
+
+
+@pytest.fixture(scope='session')
+def testcontainers_redis_container(redis_test_case: Type['_RedisTestCase']) -> Any:
+    """Redis container, keys created by `seed` are dumped once per session, same as `setUpClass` does."""
+    redis_test_case.setUpClass()
+    return redis_test_case.start_redis_container()
+
+
+@pytest.fixture
+def testcontainers_redis_client(
+    redis_test_case: Type['_RedisTestCase'], testcontainers_redis_container: Any
+) -> Generator['Redis', None, None]:
+    """Redis client, keys created by `seed` are restored before and databases are flushed after each test."""
+    test = redis_test_case()
+    test.setUp()
+    client = test.get_client()
+    try:
+        yield client
+    finally:
+        test.tearDown()
+        client.connection_pool.disconnect()
@@ -0,0 +1,59 @@
+import os
+import unittest
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+import pytest  # type: ignore
+
+from testcontainers_orm.scheduling import CostModel
+from testcontainers_orm.scheduling import get_last_tests_of_images
+from testcontainers_orm.scheduling import group_tests
+from testcontainers_orm.scheduling import stop_image_container
+
+# NOTE: Runs collected tests grouped by container image, schema and isolation strategy, same as `ScheduledTestLoader`.
+# NOTE: Enable with `-p testcontainers_orm.pytest_scheduling` or `pytest_plugins = [...]` in conftest.
+
+# NOTE: Ids of pytest items which are the last ones using an image, mapped to the image
+_last_items_of_images: Dict[str, str] = {}
+
+
+def _get_item_class(
+    item: Any,
+) -> Optional[type]:  # pylint: disable=unsubscriptable-object
+    return getattr(item, 'cls', None)
+
+
+def _get_item_id(item: Any) -> str:
+    # NOTE: Same as `unittest.TestCase.id()`, so timings recorded by test cases can be matched
+    test_class = _get_item_class(item)
+    if test_class is not None and issubclass(test_class, unittest.TestCase):
+        return f'{test_class.__module__}.{test_class.__qualname__}.{item.name}'
+    return item.nodeid
+
+
+# NOTE: pytest-xdist reads `xdist_group` marks in its own hook, so marks must be added before it
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session, config, items) -> None:
+    """Reorder collected tests by groups. Under pytest-xdist every group is marked with `xdist_group`.
+
+    With `--dist loadgroup` all tests of a group run on the same worker, groups are sent to workers as they get free.
+    """
+    groups = group_tests(items, _get_item_class, _get_item_id, CostModel.from_env())
+    if int(os.environ.get('PYTEST_XDIST_WORKER_COUNT', 1)) > 1:
+        for index, group in enumerate(groups):
+            for item in group.tests:
+                item.add_marker(pytest.mark.xdist_group(f'testcontainers_orm_{index}'))
+    # NOTE: Order of tests run by xdist workers is not known here, so containers are stopped at exit there
+    else:
+        _last_items_of_images.clear()
+        for image, item in get_last_tests_of_images(groups).items():
+            _last_items_of_images[item.nodeid] = image
+    items[:] = [item for group in groups for item in group.tests]
+
+
+def pytest_runtest_logfinish(nodeid: str, location: Any) -> None:
+    """Stop container after the last test using its image, teardown of its class is finished by then."""
+    image = _last_items_of_images.pop(nodeid, None)
+    if image is not None:
+        stop_image_container(image)
@@ -0,0 +1,96 @@
+import asyncio
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from typing import Callable
+from typing import Dict
+from typing import List
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER_RE = re.compile(r'%\(\w+\)s|%s|:\w+|\?')
+_PLACEHOLDER_LIST_RE = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_statement(statement: str) -> str:
+    """Replace literals and bind parameters with `?` so similar statements can be grouped together."""
+    statement = _STRING_LITERAL_RE.sub('?', statement)
+    statement = _NUMBER_LITERAL_RE.sub('?', statement)
+    statement = _PLACEHOLDER_RE.sub('?', statement)
+    statement = _PLACEHOLDER_LIST_RE.sub('(...)', statement)
+    return _WHITESPACE_RE.sub(' ', statement).strip()
+
+
+@dataclass
+class QueryRecord:
+    statement: str
+    duration: float
+
+    @property
+    def normalized_statement(self) -> str:
+        return normalize_statement(self.statement)
+
+
+class QueryLog:
+    """Statements executed while capture was active."""
+
+    def __init__(self) -> None:
+        self.queries: List[QueryRecord] = []
+
+    def add(self, statement: str, duration: float) -> None:
+        self.queries.append(QueryRecord(statement, duration))
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def total_time(self) -> float:
+        """Total time spent in executed statements, in seconds."""
+        return sum(query.duration for query in self.queries)
+
+    def group(self) -> Dict[str, List[QueryRecord]]:
+        groups: Dict[str, List[QueryRecord]] = OrderedDict()
+        for query in self.queries:
+            groups.setdefault(query.normalized_statement, []).append(query)
+        return groups
+
+    def format(self) -> str:
+        groups = sorted(
+            self.group().items(), key=lambda item: len(item[1]), reverse=True
+        )
+        lines = []
+        for statement, queries in groups:
+            duration = sum(query.duration for query in queries) * 1000
+            lines.append(f'{len(queries):>5} x {duration:>10.2f} ms  {statement}')
+        return '\n'.join(lines)
+
+
+def _wrap_test_method(func: Callable, context_name: str, *args) -> Callable:
+    if asyncio.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(self, *func_args, **func_kwargs):
+            with getattr(self, context_name)(*args):
+                return await func(self, *func_args, **func_kwargs)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(self, *func_args, **func_kwargs):
+        with getattr(self, context_name)(*args):
+            return func(self, *func_args, **func_kwargs)
+
+    return wrapper
+
+
+def max_queries(count: int) -> Callable[[Callable], Callable]:
+    """Decorator for test methods, same as wrapping the whole method body in `self.assertMaxQueries(count)`."""
+    return lambda func: _wrap_test_method(func, 'assertMaxQueries', count)
+
+
+def query_time_under(ms: float) -> Callable[[Callable], Callable]:
+    """Decorator for test methods, same as wrapping the whole method body in `self.assertQueryTimeUnder(ms)`."""
+    return lambda func: _wrap_test_method(func, 'assertQueryTimeUnder', ms)
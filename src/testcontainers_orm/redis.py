@@ -1,18 +1,71 @@
 import atexit
 import time
 import unittest
+from contextlib import contextmanager
+from dataclasses import asdict
+from functools import wraps
+from typing import TYPE_CHECKING
+from typing import Generator
+from typing import List
 from typing import Optional
+from typing import Tuple
 
 import redis.exceptions
 from redis import Redis
-from testcontainers.redis import RedisContainer  # type: ignore
 
+from testcontainers_orm.commands import CommandLog
+from testcontainers_orm.commands import CommandStats
+from testcontainers_orm.commands import start_capture
+from testcontainers_orm.commands import stop_capture
 from testcontainers_orm.config import RedisConfig
+from testcontainers_orm.fixtures import CHUNK_SIZE
+from testcontainers_orm.report import report
+from testcontainers_orm.utils import check_isolation
+
+# NOTE: testcontainers imports Docker SDK, so it's imported only when container is about to be created.
+if TYPE_CHECKING:
+    from testcontainers.redis import RedisContainer  # type: ignore
 
 redis_container: Optional[  # pylint: disable=unsubscriptable-object
-    RedisContainer
+    'RedisContainer'
 ] = None
 
+ISOLATION_STRATEGIES = ('flushall', 'flushdb')
+
+# NOTE: Key, TTL in milliseconds (0 - no expiration) and value serialized by `DUMP`
+DumpedKey = Tuple[bytes, int, bytes]
+
+
+def dump_keys(client: Redis, chunk_size: int = CHUNK_SIZE) -> List[DumpedKey]:
+    """Serialize all keys of client's database with pipelined `PTTL` and `DUMP`."""
+    result: List[DumpedKey] = []
+    keys = list(client.scan_iter(count=chunk_size))
+    for start in range(0, len(keys), chunk_size):
+        chunk = keys[start : start + chunk_size]
+        pipeline = client.pipeline(transaction=False)
+        for key in chunk:
+            pipeline.pttl(key)
+            pipeline.dump(key)
+        values = pipeline.execute()
+        for key, ttl, value in zip(chunk, values[::2], values[1::2]):
+            # NOTE: Key has expired after SCAN
+            if value is None:
+                continue
+            result.append((key, max(ttl, 0), value))
+    return result
+
+
+def restore_keys(
+    client: Redis, keys: List[DumpedKey], chunk_size: int = CHUNK_SIZE
+) -> None:
+    """Load keys serialized by `dump_keys` with pipelined `RESTORE`, replacing existing ones."""
+    for start in range(0, len(keys), chunk_size):
+        pipeline = client.pipeline(transaction=False)
+        for key, ttl, value in keys[start : start + chunk_size]:
+            # NOTE: Type stubs of redis don't declare `replace` argument yet
+            pipeline.restore(key, ttl, value, replace=True)  # type: ignore
+        pipeline.execute()
+
 
 # NOTE: This class left private intentionally. Otherwise it will be discovered by nosetests.
 class _RedisTestCase(unittest.TestCase):
@@ -22,21 +75,119 @@ class _RedisTestCase(unittest.TestCase):
     """
 
     HOST = '127.0.0.1'
+    IMAGE = 'redis:latest'
+
+    # Command used to reset Redis after each test: 'flushall' or 'flushdb' (flushes only the database client uses)
+    ISOLATION = 'flushall'
+
+    # Internal attributes for typehinting
+    command_stats: Optional[
+        CommandStats
+    ] = None  # pylint: disable=unsubscriptable-object
+    _seed_snapshot: List[DumpedKey] = []
 
     @classmethod
     def setUpClass(cls) -> None:
+        check_isolation(cls.ISOLATION, ISOLATION_STRATEGIES)
+        cls.start_redis_container()
+        cls.snapshot_seed()
+
+    @classmethod
+    def seed(cls, client: Redis) -> None:
+        """Populate database used by tests, override in subclasses. Called once per test case class."""
+
+    @classmethod
+    def snapshot_seed(cls) -> None:
+        """Run `seed` on empty database and keep dumped keys to restore them before each test."""
+        client = cls.get_client()
+        cls.drop_schema()
+        cls.seed(client)
+        cls._seed_snapshot = dump_keys(client)
+        cls.drop_schema()
+
+    @classmethod
+    def restore_seed(cls) -> None:
+        if cls._seed_snapshot:
+            restore_keys(cls.get_client(), cls._seed_snapshot)
+
+    @classmethod
+    def start_redis_container(cls) -> 'RedisContainer':
+        """Start Redis container unless it's already running. Container is stopped when interpreter exits."""
         global redis_container
         if not redis_container:
             redis_container = cls._create_redis_container()
             redis_container.start()
             cls._wait_for_connection()
             atexit.register(redis_container.stop)
+        return redis_container
+
+    # NOTE: Only commands of the test method are counted, `setUp` and `tearDown` restore and flush the database
+    def run(self, result=None):
+        commands = CommandLog()
+        method = getattr(self, self._testMethodName)
+
+        @wraps(method)
+        def capture_method(*args, **kwargs):
+            start_capture(commands)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                stop_capture(commands)
+
+        setattr(self, self._testMethodName, capture_method)
+        try:
+            with report.measure_duration(self.id()):
+                result = super().run(result)
+        finally:
+            delattr(self, self._testMethodName)
+
+        self.command_stats = commands.stats
+        report.add(self.id(), 'redis_commands', asdict(self.command_stats))
+        return result
+
+    @classmethod
+    @contextmanager
+    def capture_commands(cls) -> Generator[CommandLog, None, None]:
+        """Record commands and round trips of every Redis client inside the block."""
+        commands = CommandLog()
+        start_capture(commands)
+        try:
+            yield commands
+        finally:
+            stop_capture(commands)
+
+    @contextmanager
+    def assertMaxRoundTrips(self, count: int) -> Generator[CommandLog, None, None]:
+        with self.capture_commands() as commands:
+            yield commands
+        if commands.round_trips > count:
+            self.fail(
+                f'{commands.round_trips} round trips to Redis, expected at most {count}:\n{commands.format()}'
+            )
+
+    @contextmanager
+    def assertMaxCommands(self, count: int) -> Generator[CommandLog, None, None]:
+        with self.capture_commands() as commands:
+            yield commands
+        if commands.count > count:
+            self.fail(
+                f'{commands.count} Redis commands sent, expected at most {count}:\n{commands.format()}'
+            )
+
+    def setUp(self) -> None:
+        self.restore_seed()
 
     def tearDown(self) -> None:
         self.drop_schema()
 
-    def drop_schema(self) -> None:
-        self.get_client().flushall()
+    @classmethod
+    def drop_schema(cls) -> None:
+        # NOTE: Keys are removed from keyspace immediately, memory is reclaimed in background
+        # NOTE: Type stubs of redis don't declare `asynchronous` argument yet
+        if cls.ISOLATION == 'flushdb':
+            cls.get_client().flushdb(asynchronous=True)  # type: ignore
+        else:
+            cls.get_client().flushall(asynchronous=True)  # type: ignore
 
     @classmethod
     def get_config(cls) -> RedisConfig:
@@ -54,8 +205,10 @@ class _RedisTestCase(unittest.TestCase):
         )
 
     @classmethod
-    def _create_redis_container(cls) -> RedisContainer:
-        container = RedisContainer()
+    def _create_redis_container(cls) -> 'RedisContainer':
+        from testcontainers.redis import RedisContainer  # type: ignore
+
+        container = RedisContainer(cls.IMAGE)
         return container
 
     @classmethod
@@ -0,0 +1,56 @@
+import atexit
+import json
+import os
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any
+from typing import Dict
+from typing import Generator
+
+# NOTE: Path to JSON file to write the report to when interpreter exits. Report is not written if variable is not set.
+REPORT_PATH_ENV = 'TESTCONTAINERS_ORM_REPORT'
+
+
+class Report:
+    """Per-test measurements collected by test cases, keyed by test id and section name."""
+
+    def __init__(self) -> None:
+        self._tests: Dict[str, Dict[str, Any]] = OrderedDict()
+
+    def __bool__(self) -> bool:
+        return bool(self._tests)
+
+    def add(self, test_id: str, section: str, data: Any) -> None:
+        self._tests.setdefault(test_id, OrderedDict())[section] = data
+
+    @contextmanager
+    def measure_duration(self, test_id: str) -> Generator[None, None, None]:
+        """Add time spent inside the block to `duration` section, e.g. to estimate costs of test groups."""
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(test_id, 'duration', time.perf_counter() - start_time)
+
+    def get(self, test_id: str) -> Dict[str, Any]:
+        return self._tests.get(test_id, {})
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        return dict(self._tests)
+
+    def dump(self, path: str) -> None:
+        with open(path, 'w') as file:
+            json.dump(self.as_dict(), file, indent=2, default=str)
+
+
+report = Report()
+
+
+def _dump_report() -> None:
+    path = os.environ.get(REPORT_PATH_ENV)
+    if path and report:
+        report.dump(path)
+
+
+atexit.register(_dump_report)
@@ -0,0 +1,256 @@
+import json
+import os
+import unittest
+from collections import OrderedDict
+from dataclasses import dataclass
+from dataclasses import field
+from functools import wraps
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from testcontainers_orm.report import REPORT_PATH_ENV
+
+# NOTE: Path to JSON report of a previous run (see `testcontainers_orm.report`) used to estimate test durations.
+# NOTE: Falls back to `REPORT_PATH_ENV`, so the report of the previous run is used by the next one.
+TIMINGS_PATH_ENV = 'TESTCONTAINERS_ORM_TIMINGS'
+
+# NOTE: Estimated durations in seconds used when there are no recorded timings
+DEFAULT_TEST_COST = 1.0
+DEFAULT_SETUP_COST = 10.0
+
+# NOTE: Container image, schema fingerprint and isolation strategy
+GroupKey = Tuple[str, str, str]
+
+
+def get_group_key(
+    test_class: Optional[type],
+) -> GroupKey:  # pylint: disable=unsubscriptable-object
+    """Test cases with the same key share container and schema, so they should be run one after another."""
+    fingerprint = None
+    get_schema_fingerprint = getattr(test_class, 'get_schema_fingerprint', None)
+    if get_schema_fingerprint is not None:
+        try:
+            fingerprint = get_schema_fingerprint()
+        # NOTE: Abstract test cases without models
+        except NotImplementedError:
+            pass
+    return (
+        getattr(test_class, 'IMAGE', None) or '',
+        fingerprint or '',
+        getattr(test_class, 'ISOLATION', None) or '',
+    )
+
+
+@dataclass
+class ScheduleGroup:
+    key: GroupKey
+    tests: List[Any] = field(default_factory=list)
+    cost: float = 0.0
+
+
+class CostModel:
+    """Estimates durations of test groups from timings recorded in a previous run."""
+
+    def __init__(
+        self,
+        timings: Optional[Dict[str, float]] = None,
+        setup_cost: float = DEFAULT_SETUP_COST,
+    ) -> None:
+        self.timings = timings or {}
+        self.setup_cost = setup_cost
+        self.default_test_cost = (
+            sum(self.timings.values()) / len(self.timings)
+            if self.timings
+            else DEFAULT_TEST_COST
+        )
+
+    @classmethod
+    def from_report(cls, path: str) -> 'CostModel':
+        with open(path) as file:
+            tests = json.load(file)
+        return cls(
+            {
+                test_id: sections['duration']
+                for test_id, sections in tests.items()
+                if 'duration' in sections
+            }
+        )
+
+    @classmethod
+    def from_env(cls) -> 'CostModel':
+        path = os.environ.get(TIMINGS_PATH_ENV) or os.environ.get(REPORT_PATH_ENV)
+        if path and os.path.exists(path):
+            return cls.from_report(path)
+        return cls()
+
+    def test_cost(self, test_id: str) -> float:
+        return self.timings.get(test_id, self.default_test_cost)
+
+    def group_setup_cost(self, key: GroupKey) -> float:
+        image, _, _ = key
+        return self.setup_cost if image else 0.0
+
+
+def group_tests(
+    tests: Iterable[Any],
+    get_class: Callable[
+        [Any], Optional[type]
+    ],  # pylint: disable=unsubscriptable-object
+    get_id: Callable[[Any], str],
+    cost_model: CostModel,
+) -> List[ScheduleGroup]:
+    """Group tests by container image, schema and isolation strategy keeping tests of a class together.
+
+    Groups are sorted by key, so groups using the same image are adjacent and container is started once per image.
+    """
+    tests_by_class: Dict[
+        Optional[type], List[Any]
+    ] = OrderedDict()  # pylint: disable=unsubscriptable-object
+    for test in tests:
+        tests_by_class.setdefault(get_class(test), []).append(test)
+
+    groups: Dict[GroupKey, ScheduleGroup] = {}
+    for test_class, class_tests in tests_by_class.items():
+        key = get_group_key(test_class)
+        group = groups.setdefault(
+            key, ScheduleGroup(key, cost=cost_model.group_setup_cost(key))
+        )
+        group.tests.extend(class_tests)
+        group.cost += sum(cost_model.test_cost(get_id(test)) for test in class_tests)
+
+    return sorted(groups.values(), key=lambda g: g.key)
+
+
+def balance_groups(
+    groups: List[ScheduleGroup], workers: int
+) -> List[List[ScheduleGroup]]:
+    """Distribute groups among workers, largest first to the least loaded one. Groups are never split."""
+    loads = [0.0] * workers
+    assignments: List[List[ScheduleGroup]] = [[] for _ in range(workers)]
+    for group in sorted(groups, key=lambda g: g.cost, reverse=True):
+        worker = loads.index(min(loads))
+        assignments[worker].append(group)
+        loads[worker] += group.cost
+    return [sorted(worker_groups, key=lambda g: g.key) for worker_groups in assignments]
+
+
+def get_last_tests_of_images(groups: List[ScheduleGroup]) -> Dict[str, Any]:
+    """Map every image to the last test using it, container can be stopped once this test is finished."""
+    return {
+        group.key[0]: group.tests[-1]
+        for group in groups
+        if group.key[0] and group.tests
+    }
+
+
+def stop_image_container(image: str) -> None:
+    # NOTE: Imported here, so loading the pytest plugin doesn't import test case modules
+    from testcontainers_orm.database import stop_db_container
+
+    stop_db_container(image)
+
+
+class _StopImageContainer(unittest.TestCase):
+    """Suite item stopping database container after the last test using its image; its class is torn down by then.
+
+    It's not a test, so it's neither counted nor reported.
+    """
+
+    def __init__(self, image: str) -> None:
+        super().__init__()
+        self.image = image
+
+    def runTest(self) -> None:
+        stop_image_container(self.image)
+
+    def run(
+        self, result: Optional[unittest.TestResult] = None
+    ) -> Optional[unittest.TestResult]:  # pylint: disable=unsubscriptable-object
+        self.runTest()
+        return result
+
+    def countTestCases(self) -> int:
+        return 0
+
+
+def _iter_tests(suite: unittest.TestSuite) -> Iterator[unittest.TestCase]:
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        # NOTE: Suite is already scheduled, containers are stopped by the new schedule
+        elif not isinstance(test, _StopImageContainer):
+            yield test
+
+
+def schedule_suite(
+    suite: unittest.TestSuite,
+    cost_model: Optional[CostModel] = None,  # pylint: disable=unsubscriptable-object
+    worker: int = 0,
+    workers: int = 1,
+) -> unittest.TestSuite:
+    """Reorder tests of a suite by groups. With several workers only groups assigned to a given one are returned."""
+    groups = group_tests(
+        _iter_tests(suite),
+        type,
+        lambda test: test.id(),
+        cost_model or CostModel.from_env(),
+    )
+    groups = balance_groups(groups, workers)[worker]
+    last_tests = {
+        id(test): image for image, test in get_last_tests_of_images(groups).items()
+    }
+    scheduled_suite = unittest.TestSuite()
+    for group in groups:
+        for test in group.tests:
+            scheduled_suite.addTest(test)
+            if id(test) in last_tests:
+                scheduled_suite.addTest(_StopImageContainer(last_tests[id(test)]))
+    return scheduled_suite
+
+
+def _scheduled(method: Callable) -> Callable:
+    # NOTE: Loader methods call each other, suite is scheduled only once by the outermost call
+    @wraps(method)
+    def wrapper(self: 'ScheduledTestLoader', *args, **kwargs):
+        self._depth += 1
+        try:
+            suite = method(self, *args, **kwargs)
+        finally:
+            self._depth -= 1
+        if self._depth:
+            return suite
+        return schedule_suite(suite, self.cost_model, self.worker, self.workers)
+
+    return wrapper
+
+
+class ScheduledTestLoader(unittest.TestLoader):
+    """Test loader which returns tests grouped by container image, schema and isolation strategy.
+
+    Usage: `unittest.main(testLoader=ScheduledTestLoader())`
+    """
+
+    def __init__(
+        self,
+        cost_model: Optional[
+            CostModel
+        ] = None,  # pylint: disable=unsubscriptable-object
+        worker: int = 0,
+        workers: int = 1,
+    ) -> None:
+        super().__init__()
+        self.cost_model = cost_model
+        self.worker = worker
+        self.workers = workers
+        self._depth = 0
+
+    discover = _scheduled(unittest.TestLoader.discover)
+    loadTestsFromModule = _scheduled(unittest.TestLoader.loadTestsFromModule)
+    loadTestsFromName = _scheduled(unittest.TestLoader.loadTestsFromName)
+    loadTestsFromNames = _scheduled(unittest.TestLoader.loadTestsFromNames)
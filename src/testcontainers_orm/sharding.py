@@ -0,0 +1,216 @@
+import atexit
+import bisect
+import hashlib
+import os
+import re
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any
+from typing import Dict
+from typing import Generator
+from typing import Generic
+from typing import Optional
+from typing import Sequence
+from typing import TypeVar
+
+# NOTE: Number of database containers shared by parallel workers: a number or 'auto' (one per `CPUS_PER_SHARD` cores).
+# NOTE: Sharding is enabled only when workers share a run id, otherwise every process starts its own container.
+SHARDS_ENV = 'TESTCONTAINERS_ORM_SHARDS'
+# NOTE: Identifier of a test run shared by all workers, set by pytest-xdist automatically
+RUN_ID_ENV = 'TESTCONTAINERS_ORM_RUN_ID'
+# NOTE: Identifier of a worker within a run, e.g. index of a process started with `ScheduledTestLoader(worker=...)`
+WORKER_ID_ENV = 'TESTCONTAINERS_ORM_WORKER'
+
+CPUS_PER_SHARD = 2
+HASH_RING_REPLICAS = 64
+# NOTE: Seconds a worker which started a shared container waits at exit for other workers to release it
+RELEASE_TIMEOUT = 600.0
+RELEASE_POLL_INTERVAL = 0.5
+
+_NAME_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+T = TypeVar('T')
+
+
+class HashRing(Generic[T]):
+    """Consistent hashing: adding a node moves only keys which now belong to it, other workers keep their shards."""
+
+    def __init__(self, nodes: Sequence[T], replicas: int = HASH_RING_REPLICAS) -> None:
+        if not nodes:
+            raise ValueError('Hash ring must have at least one node')
+        points = sorted(
+            (self._hash(f'{node}:{replica}'), index)
+            for index, node in enumerate(nodes)
+            for replica in range(replicas)
+        )
+        self._nodes = list(nodes)
+        self._hashes = [point for point, _ in points]
+        self._indexes = [index for _, index in points]
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int(hashlib.md5(key.encode()).hexdigest()[:16], 16)
+
+    def get(self, key: str) -> T:
+        position = bisect.bisect(self._hashes, self._hash(key)) % len(self._hashes)
+        return self._nodes[self._indexes[position]]
+
+
+def get_run_id() -> Optional[str]:  # pylint: disable=unsubscriptable-object
+    return os.environ.get(RUN_ID_ENV) or os.environ.get('PYTEST_XDIST_TESTRUNUID')
+
+
+def get_worker_id() -> str:
+    worker_id = (
+        os.environ.get(WORKER_ID_ENV) or os.environ.get('PYTEST_XDIST_WORKER') or 'main'
+    )
+    return _NAME_RE.sub('_', worker_id)
+
+
+def get_shard_count() -> int:
+    value = os.environ.get(SHARDS_ENV, '1')
+    if value == 'auto':
+        return max(1, (os.cpu_count() or 1) // CPUS_PER_SHARD)
+    return max(1, int(value))
+
+
+def is_sharded() -> bool:
+    return get_shard_count() > 1 and get_run_id() is not None
+
+
+def get_shard(worker_id: str, shards: int) -> int:
+    return HashRing(range(shards)).get(worker_id)
+
+
+def get_worker_database(name: str) -> str:
+    """Workers sharing a container use their own databases."""
+    if not is_sharded():
+        return name
+    return f'{name}_{get_worker_id()}'
+
+
+def get_resource_limits(shards: int) -> Dict[str, int]:
+    """Docker `run` arguments limiting CPU and memory of a container to its share of the host."""
+    limits = {'nano_cpus': int((os.cpu_count() or 1) * 10 ** 9 / shards)}
+    try:
+        limits['mem_limit'] = (
+            os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // shards
+        )
+    except (ValueError, OSError, AttributeError):
+        pass
+    return limits
+
+
+def get_container_name(image: str, run_id: str, shard: int) -> str:
+    return f'testcontainers-orm-{_NAME_RE.sub("_", image)}-{_NAME_RE.sub("_", run_id)}-{shard}'
+
+
+def _get_lock_path(name: str) -> str:
+    return os.path.join(tempfile.gettempdir(), f'{name}.lock')
+
+
+def _is_current_file(file: Any, path: str) -> bool:
+    try:
+        return os.stat(path).st_ino == os.fstat(file.fileno()).st_ino
+    except FileNotFoundError:
+        return False
+
+
+@contextmanager
+def _locked_file(name: str) -> Generator[Any, None, None]:
+    # NOTE: Workers of a run are processes on the same host, so a file lock serializes starting a shared container
+    try:
+        import fcntl
+    except ImportError:
+        raise RuntimeError(
+            f'Sharded containers require a Unix host, unset {SHARDS_ENV} to start a container per worker'
+        ) from None
+
+    path = _get_lock_path(name)
+    while True:
+        with open(path, 'a+') as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                # NOTE: File is removed by the last worker, lock of a removed file doesn't serialize anything
+                if _is_current_file(file, path):
+                    yield file
+                    return
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+
+def _update_references(file: Any, delta: int) -> int:
+    file.seek(0)
+    references = int(file.read() or 0) + delta
+    file.seek(0)
+    file.truncate()
+    file.write(str(references))
+    file.flush()
+    return references
+
+
+class SharedContainer:
+    """Container started by one of workers and used by others, stopped when the last worker releases it.
+
+    Use `stop` of this object only, testcontainers object it was configured with is not stopped directly.
+    """
+
+    def __init__(self, container: Any, name: str) -> None:
+        self.container = container
+        self.name = name
+        self._wrapped: Any = None
+
+    @property
+    def image(self) -> str:
+        return self.container.image
+
+    @property
+    def port_to_expose(self) -> int:
+        return self.container.port_to_expose
+
+    def start(self) -> 'SharedContainer':
+        from docker.errors import NotFound  # type: ignore
+
+        client = self.container.get_docker_client()
+        with _locked_file(self.name) as file:
+            try:
+                self._wrapped = client.client.containers.get(self.name)
+            # NOTE: Container started by another worker is ready, it's started while the lock is held
+            except NotFound:
+                self._wrapped = (
+                    self.container.with_name(self.name).start().get_wrapped_container()
+                )
+                # NOTE: Testcontainers object removes container when it's garbage collected, so it's kept until exit
+                atexit.register(self._wait_for_release)
+            _update_references(file, 1)
+        return self
+
+    def stop(self) -> None:
+        if self._wrapped is None:
+            return
+        with _locked_file(self.name) as file:
+            if _update_references(file, -1) <= 0:
+                self._wrapped.remove(force=True, v=True)
+                os.remove(_get_lock_path(self.name))
+        self._wrapped = None
+
+    def _wait_for_release(self, timeout: float = RELEASE_TIMEOUT) -> None:
+        """Wait until the last worker removes container and its lock file."""
+        deadline = time.monotonic() + timeout
+        while os.path.exists(_get_lock_path(self.name)) and time.monotonic() < deadline:
+            time.sleep(RELEASE_POLL_INTERVAL)
+
+    def get_wrapped_container(self) -> Any:
+        return self._wrapped
+
+    def get_container_host_ip(self) -> str:
+        return self.container.get_docker_client().host() or 'localhost'
+
+    def get_exposed_port(self, port: Any) -> int:
+        return int(self.container.get_docker_client().port(self._wrapped.id, port))
+
+
+def start_shared_container(container: Any, name: str) -> SharedContainer:
+    """Start container with a given name or attach to one started by another worker."""
+    return SharedContainer(container, name).start()
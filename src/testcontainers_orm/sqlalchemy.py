@@ -1,37 +1,86 @@
 import logging
 import os.path
+import time
 from abc import ABC
 from contextlib import contextmanager
+from dataclasses import asdict
 from datetime import timedelta
+from typing import Any
+from typing import Callable
+from typing import Dict
 from typing import Generator
 from typing import Generic
+from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
+from typing import Union
+from typing import cast
 
-import alembic.command  # type: ignore
-import alembic.config  # type: ignore
 import sqlalchemy.exc  # type: ignore
 import sqlalchemy.orm  # type: ignore
-import typing_inspect  # type: ignore
+from sqlalchemy import event  # type: ignore
 from sqlalchemy import inspect  # type: ignore
+from sqlalchemy.dialects import mysql  # type: ignore
 from sqlalchemy.engine import Connection  # type: ignore
 from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Transaction
 from sqlalchemy.engine import create_engine
 from sqlalchemy.ext.declarative import as_declarative  # type: ignore
 from sqlalchemy.orm import sessionmaker  # type: ignore
 from sqlalchemy.orm.session import close_all_sessions  # type: ignore
-from sqlalchemy_repr import RepresentableBase  # type: ignore
+from sqlalchemy.schema import CreateIndex  # type: ignore
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.schema import Table
 
 from testcontainers_orm.config import DatabaseConfig
+from testcontainers_orm.connections import PoolMonitor
+from testcontainers_orm.connections import PoolStats
 from testcontainers_orm.database import _MySQLDatabaseTestCase
+from testcontainers_orm.ddl import run_in_levels
+from testcontainers_orm.ddl import topological_levels
+from testcontainers_orm.fingerprint import FINGERPRINT_TABLE
+from testcontainers_orm.fingerprint import drop_all_tables
+from testcontainers_orm.fingerprint import files_fingerprint
+from testcontainers_orm.fingerprint import hash_strings
+from testcontainers_orm.fingerprint import read_fingerprint
+from testcontainers_orm.fingerprint import write_fingerprint
+from testcontainers_orm.fixtures import CHUNK_SIZE
+from testcontainers_orm.fixtures import Fixture
+from testcontainers_orm.fixtures import restore_statements
+from testcontainers_orm.fixtures import snapshot_statements
+from testcontainers_orm.queries import QueryLog
+from testcontainers_orm.report import report
+from testcontainers_orm.sharding import get_worker_database
+from testcontainers_orm.synthetic import ColumnSpec
+from testcontainers_orm.synthetic import TableSpec
+from testcontainers_orm.synthetic import generate_chunks
+from testcontainers_orm.synthetic import mark_unique_together
+from testcontainers_orm.utils import check_isolation
 from testcontainers_orm.utils import classproperty
 
 Session = sessionmaker()
 
-# NOTE: https://github.com/dropbox/sqlalchemy-stubs/issues/40
-Base = as_declarative()(RepresentableBase)
+_base: Optional[Type] = None  # pylint: disable=unsubscriptable-object
+
+
+def get_base() -> Type:
+    """Default declarative base, created on first access to avoid importing sqlalchemy_repr eagerly."""
+    global _base
+    if _base is None:
+        from sqlalchemy_repr import RepresentableBase  # type: ignore
+
+        # NOTE: https://github.com/dropbox/sqlalchemy-stubs/issues/40
+        _base = as_declarative()(RepresentableBase)
+    return _base
+
+
+def __getattr__(name: str) -> Any:
+    if name == 'Base':
+        return get_base()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 class Storage(sqlalchemy.orm.Session):
@@ -40,6 +89,103 @@ class Storage(sqlalchemy.orm.Session):
 
 TStorage = TypeVar('TStorage', bound=Storage)
 
+# NOTE: Keys of connection record's `info` shared by all monitors
+_CONNECT_START_KEY = 'testcontainers_orm_connect_start'
+_WAIT_TIME_KEY = 'testcontainers_orm_wait_time'
+_TRANSACTION_KEY = 'testcontainers_orm_transaction'
+
+ISOLATION_STRATEGIES = ('drop_create', 'truncate', 'rollback')
+
+
+class SQLAlchemyPoolMonitor(PoolMonitor):
+    """Collects pool usage of given engines via SQLAlchemy events, engines created later are added with `watch`.
+
+    Pool events don't expose time spent waiting in the queue, so `wait_time` is time spent establishing new connections.
+    """
+
+    def __init__(self, *engines: Engine) -> None:
+        super().__init__()
+        self._engines = list(engines)
+        # NOTE: Disposed engine replaces its pool, so listeners are removed from the pool they were added to
+        self._watched: List[Tuple[Engine, Any]] = []
+
+    def start(self) -> None:
+        for engine in self._engines:
+            self.watch(engine)
+
+    def watch(self, engine: Engine) -> None:
+        """Listen to events of an engine and its current pool."""
+        pool = engine.pool
+        event.listen(engine, 'do_connect', self._on_do_connect)
+        event.listen(pool, 'connect', self._on_connect)
+        event.listen(pool, 'checkout', self._on_checkout)
+        event.listen(pool, 'checkin', self._on_checkin)
+        event.listen(engine, 'begin', self._on_begin)
+        event.listen(engine, 'commit', self._on_transaction_end)
+        event.listen(engine, 'rollback', self._on_transaction_end)
+        self._watched.append((engine, pool))
+
+    def stop(self) -> None:
+        for engine, pool in self._watched:
+            event.remove(engine, 'do_connect', self._on_do_connect)
+            event.remove(pool, 'connect', self._on_connect)
+            event.remove(pool, 'checkout', self._on_checkout)
+            event.remove(pool, 'checkin', self._on_checkin)
+            event.remove(engine, 'begin', self._on_begin)
+            event.remove(engine, 'commit', self._on_transaction_end)
+            event.remove(engine, 'rollback', self._on_transaction_end)
+        self._watched.clear()
+
+    def _on_do_connect(self, dialect, connection_record, cargs, cparams) -> None:
+        connection_record.info.setdefault(_CONNECT_START_KEY, time.perf_counter())
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        start_time = connection_record.info.pop(_CONNECT_START_KEY, None)
+        if start_time is not None:
+            connection_record.info[_WAIT_TIME_KEY] = time.perf_counter() - start_time
+
+    def _on_checkout(
+        self, dbapi_connection, connection_record, connection_proxy
+    ) -> None:
+        self.checkout(
+            id(connection_record),
+            connection_proxy,
+            connection_record.info.get(_WAIT_TIME_KEY, 0.0),
+        )
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        # NOTE: Pool rolls back connections on checkin. Detached connections have no record.
+        if connection_record is not None:
+            connection_record.info.pop(_WAIT_TIME_KEY, None)
+            connection_record.info.pop(_TRANSACTION_KEY, None)
+        self.checkin(id(connection_record))
+
+    # NOTE: Accessing `info` of invalidated connection tries to reconnect, which fails inside of invalid transaction
+    def _on_begin(self, connection) -> None:
+        if not connection.invalidated:
+            connection.info[_TRANSACTION_KEY] = True
+
+    def _on_transaction_end(self, connection) -> None:
+        if not connection.invalidated:
+            connection.info.pop(_TRANSACTION_KEY, None)
+
+    def _in_transaction(self, key: int, connection: Any) -> bool:
+        return bool(connection.info.get(_TRANSACTION_KEY))
+
+    def _release(self, connection: Any) -> None:
+        # NOTE: Invalidation closes DBAPI connection, so locks held by it are released on the server side too
+        connection.invalidate()
+
+
+# NOTE: Monitors of running test cases, they watch every engine created by factories and test cases of this module
+_test_pool_monitors: List[SQLAlchemyPoolMonitor] = []
+
+
+def _watch_engine(engine: Engine) -> Engine:
+    for monitor in _test_pool_monitors:
+        monitor.watch(engine)
+    return engine
+
 
 class EngineFactory(Generic[TStorage]):
     def __init__(self, config: DatabaseConfig) -> None:
@@ -48,6 +194,16 @@ class EngineFactory(Generic[TStorage]):
             config.driver = 'mysql+pymysql'
         self._config: DatabaseConfig = config
         self._engine: Optional[Engine] = None  # pylint: disable=unsubscriptable-object
+        self._pool_monitor: Optional[
+            SQLAlchemyPoolMonitor
+        ] = None  # pylint: disable=unsubscriptable-object
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        """Usage of connection pool during factory lifetime."""
+        if self._pool_monitor is None:
+            return PoolStats()
+        return self._pool_monitor.stats
 
     def _create_engine(self) -> Engine:
         connection_string = self._config.connection_string
@@ -58,7 +214,9 @@ class EngineFactory(Generic[TStorage]):
             pool_recycle=self._config.pool_recycle,
             pool_pre_ping=self._config.pool_pre_ping,
         )
-        return engine
+        self._pool_monitor = SQLAlchemyPoolMonitor(engine)
+        self._pool_monitor.start()
+        return _watch_engine(engine)
 
     def _get_engine(self) -> Engine:
         if self._engine is None:
@@ -66,6 +224,15 @@ class EngineFactory(Generic[TStorage]):
 
         return self._engine
 
+    def dispose(self) -> None:
+        """Stop collecting pool stats and close pooled connections of the engine."""
+        if self._engine is None:
+            return
+        if self._pool_monitor is not None:
+            self._pool_monitor.stop()
+        self._engine.dispose()
+        self._engine = None
+
 
 class ConnectionFactory(EngineFactory):
     def _create_connection(self) -> sqlalchemy.engine.base.Connection:
@@ -85,7 +252,20 @@ class ConnectionFactory(EngineFactory):
 
 
 class SessionFactory(EngineFactory[TStorage]):
+    # NOTE: Storage class can be passed explicitly when it's known at runtime only, e.g. `STORAGE_CLASS` of test case
+    def __init__(
+        self,
+        config: DatabaseConfig,
+        storage_class: Optional[Type[TStorage]] = None,
+    ) -> None:  # pylint: disable=unsubscriptable-object
+        super().__init__(config)
+        self._storage_class = storage_class
+
     def _get_storage_class(self) -> Type[TStorage]:
+        if self._storage_class is not None:
+            return self._storage_class
+        import typing_inspect  # type: ignore
+
         generic_type = typing_inspect.get_generic_type(self)
         type_parameters = typing_inspect.get_args(generic_type)
         return type_parameters[0]
@@ -109,6 +289,111 @@ class SessionFactory(EngineFactory[TStorage]):
             session.close()
 
 
+def _get_table_levels(tables: List[Table]) -> List[List[Table]]:
+    return topological_levels(
+        tables,
+        lambda table: table.name,
+        lambda table: [
+            foreign_key.column.table.name for foreign_key in table.foreign_keys
+        ],
+    )
+
+
+def create_all_parallel(engine: Engine, tables: List[Table], workers: int) -> None:
+    """Same as `MetaData.create_all`, but independent tables are created concurrently using pooled connections."""
+    existing_tables = set(inspect(engine).get_table_names())
+
+    def create_table(table: Table) -> None:
+        with engine.connect() as connection:
+            connection.execute(CreateTable(table))
+            for index in table.indexes:
+                index.create(connection)
+
+    run_in_levels(
+        _get_table_levels(
+            [table for table in tables if table.name not in existing_tables]
+        ),
+        create_table,
+        workers,
+    )
+
+
+def drop_all_parallel(engine: Engine, tables: List[Table], workers: int) -> None:
+    """Same as `MetaData.drop_all`, but independent tables are dropped concurrently using pooled connections."""
+
+    def drop_table(table: Table) -> None:
+        with engine.connect() as connection:
+            connection.execute(f'DROP TABLE IF EXISTS `{table.name}`')
+
+    run_in_levels(list(reversed(_get_table_levels(tables))), drop_table, workers)
+
+
+def get_table_spec(table: Table, rows: int) -> TableSpec:
+    """Describe table for synthetic data generator. Columns with server defaults are filled by the database."""
+    unique_groups = [
+        [column.name for column in constraint.columns]
+        for constraint in table.constraints
+        if isinstance(constraint, sqlalchemy.UniqueConstraint)
+    ] + [
+        [column.name for column in index.columns]
+        for index in table.indexes
+        if index.unique
+    ]
+    columns = []
+    for column in table.columns:
+        if column.server_default is not None and not column.primary_key:
+            continue
+        column_type = column.type
+        try:
+            python_type = column_type.python_type
+        except NotImplementedError:
+            python_type = type(None)
+        if isinstance(column_type, mysql.TINYINT):
+            max_value: Optional[int] = 127
+        elif isinstance(column_type, sqlalchemy.SmallInteger):
+            max_value = 2 ** 15 - 1
+        else:
+            max_value = None
+        foreign_keys = list(column.foreign_keys)
+        columns.append(
+            ColumnSpec(
+                name=column.name,
+                python_type=python_type,
+                nullable=bool(column.nullable),
+                unique=bool(column.unique) or column.primary_key,
+                primary_key=column.primary_key,
+                length=getattr(column_type, 'length', None),
+                precision=getattr(column_type, 'precision', None),
+                scale=getattr(column_type, 'scale', None),
+                max_value=max_value,
+                choices=column_type.enums
+                if isinstance(column_type, sqlalchemy.Enum)
+                else (),
+                references=foreign_keys[0].column.table.name if foreign_keys else None,
+            )
+        )
+    for names in unique_groups:
+        mark_unique_together(columns, names)
+    return TableSpec(table.name, rows, columns)
+
+
+RequiredTable = Union[str, Type]
+
+
+def _get_table_name(table: RequiredTable) -> str:
+    return table if isinstance(table, str) else table.__table__.name
+
+
+def required_tables(*tables: RequiredTable) -> Callable[[Callable], Callable]:
+    """Decorator for test methods, same as `REQUIRED_TABLES` but applied to a single test with 'drop_create' isolation."""
+
+    def decorator(func: Callable) -> Callable:
+        func.__required_tables__ = list(tables)  # type: ignore
+        return func
+
+    return decorator
+
+
 class FakeEnum(sqlalchemy.types.Enum):
     def __init__(self, *args, **kwargs):
         kwargs = {**kwargs, 'create_constraint': False, 'native_enum': False}
@@ -122,7 +407,7 @@ class _SQLAlchemyTestCase(_MySQLDatabaseTestCase):
     @classproperty
     def DECLARATIVE_BASE(self) -> Type:
         """Declarative base SQLAlchemy models are inherited from."""
-        return Base
+        return get_base()
 
     @classproperty
     def STORAGE_CLASS(self) -> Type[Storage]:
@@ -130,49 +415,404 @@ class _SQLAlchemyTestCase(_MySQLDatabaseTestCase):
         """Storage class to use as session factory generic type."""
         return Storage
 
+    @classproperty
+    def FIXTURES(self) -> List[Fixture]:
+        """Rows loaded once per class. Seeded state is restored before each test instead of loading fixtures again."""
+        return []
+
+    @classproperty
+    def FIXTURES_DATABASE(self) -> str:
+        """Name of schema used to store snapshot of seeded tables."""
+        return get_worker_database('test_fixtures')
+
+    @classproperty
+    def REQUIRED_TABLES(self) -> List[RequiredTable]:
+        """Table names or models used by tests. Only these tables and tables they reference are created. Empty for all."""
+        return []
+
+    # Strategy used to isolate tests from each other:
+    # 'drop_create' - schema is created before and dropped after each test
+    # 'truncate' - schema is created once per class, tables are truncated after each test
+    # 'rollback' - schema is created once per class, `self.storage`, `get_session()` and `get_connection()` share
+    #              a single connection with outer transaction which is rolled back after each test
+    ISOLATION = 'drop_create'
+
+    # Fail tests which leave connections checked out (or transactions open) after all sessions are closed.
+    # NOTE: Only pools of engines created by factories and test cases of this module are checked, leaked connections are
+    # NOTE: invalidated.
+    CHECK_CONNECTION_LEAKS = False
+
+    # Number of connections used to create and drop tables independent of each other concurrently.
+    # NOTE: Foreign key cycles are not supported with more than one worker.
+    DDL_WORKERS = 1
+
+    # Internal attributes for typehinting
+    pool_stats: Optional[PoolStats] = None
+    _pool_monitor: Optional[SQLAlchemyPoolMonitor] = None
+    _isolation_connection: Optional[Connection] = None
+    _isolation_transaction: Optional[Transaction] = None
+    _isolation_connection_factory: Optional[ConnectionFactory] = None
+
+    # NOTE: With 'rollback' isolation fixtures are loaded once and never modified, so snapshot is not needed.
+    @classmethod
+    def setUpClass(cls) -> None:
+        check_isolation(cls.ISOLATION, ISOLATION_STRATEGIES)
+        super().setUpClass()
+        if cls.ISOLATION != 'drop_create' or cls.FIXTURES:
+            cls.build_schema()
+        if cls.FIXTURES:
+            cls.load_fixtures()
+            if cls.ISOLATION != 'rollback':
+                cls.snapshot_fixtures()
+            if cls.ISOLATION == 'drop_create':
+                cls.drop_schema()
+
+    # NOTE: Schema is left in place for the next test case with the same fingerprint, only seeded rows are removed.
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        if cls.ISOLATION != 'drop_create' and cls.FIXTURES:
+            cls.truncate_schema()
+        if cls.FIXTURES and cls.ISOLATION != 'rollback':
+            with cls.get_connection() as connection:
+                connection.execute(
+                    f'DROP DATABASE IF EXISTS `{cls.FIXTURES_DATABASE}`;'
+                )
+
     def setUp(self) -> None:
-        self.create_schema()
+        if self.ISOLATION == 'drop_create':
+            self.create_schema(self._get_test_tables())
+            if self.FIXTURES:
+                self.restore_fixtures()
+        elif self.ISOLATION == 'rollback':
+            self.begin_isolation_transaction()
 
     def tearDown(self):
         close_all_sessions()
-        self.drop_schema()
+        if self.ISOLATION == 'rollback':
+            self.rollback_isolation_transaction()
+        try:
+            self.assertNoConnectionLeaks()
+        finally:
+            if self.ISOLATION == 'drop_create':
+                self.drop_schema(self._get_test_tables())
+            elif self.ISOLATION == 'truncate':
+                self.truncate_schema()
+                if self.FIXTURES:
+                    self.restore_fixtures()
+
+    def begin_isolation_transaction(self) -> None:
+        self._isolation_connection_factory = ConnectionFactory(self.get_config())
+        connection = self._isolation_connection_factory._create_connection()
+        type(self)._isolation_connection = connection
+        self._isolation_transaction = connection.begin()
+        self.storage = self._create_isolated_session(self.STORAGE_CLASS, connection)
+
+    def rollback_isolation_transaction(self) -> None:
+        connection, transaction = (
+            self._isolation_connection,
+            self._isolation_transaction,
+        )
+        type(self)._isolation_connection, self._isolation_transaction = None, None
+        if transaction is not None:
+            transaction.rollback()
+        if connection is not None:
+            connection.close()
+        if self._isolation_connection_factory is not None:
+            self._isolation_connection_factory.dispose()
+            self._isolation_connection_factory = None
 
     def run(self, result=None):
-        session_factory = SessionFactory[self.STORAGE_CLASS](self.get_config())
-        with session_factory.create() as storage:
-            self.storage = storage
-            super().run(result)
+        with self.monitor_pool():
+            with self.create_storage() as storage:
+                self.storage = storage
+                super().run(result)
+
+                # NOTE: http://jira.b9prime.net:8080/browse/CORE-205
+                self.storage = None
+
+        report.add(self.id(), 'pool', asdict(self.pool_stats))
 
-            # NOTE: http://jira.b9prime.net:8080/browse/CORE-205
-            self.storage = None
+    @contextmanager
+    def create_storage(self) -> Generator[Storage, None, None]:
+        """Session of `STORAGE_CLASS` used as `self.storage`, committed on exit."""
+        session_factory: SessionFactory[Storage] = SessionFactory(
+            self.get_config(), self.STORAGE_CLASS
+        )
+        try:
+            with session_factory.create() as storage:
+                yield storage
+        finally:
+            session_factory.dispose()
+
+    @contextmanager
+    def monitor_pool(self) -> Generator[SQLAlchemyPoolMonitor, None, None]:
+        """Collect `self.pool_stats` of engines created inside the block, required by `assertNoConnectionLeaks`.
+
+        Engines of `EngineFactory` subclasses and `_get_engine()` are watched, engines created by other code are not.
+        """
+        self._pool_monitor = SQLAlchemyPoolMonitor()
+        self._pool_monitor.start()
+        _test_pool_monitors.append(self._pool_monitor)
+        try:
+            yield self._pool_monitor
+        finally:
+            _test_pool_monitors.remove(self._pool_monitor)
+            self._pool_monitor.stop()
+            self.pool_stats = self._pool_monitor.stats
+
+    def assertNoConnectionLeaks(self) -> None:
+        """Check that every connection checked out during the test is returned to its pool.
+
+        Leaked connections are invalidated before failing, so they don't block dropping the schema.
+        """
+        if not self.CHECK_CONNECTION_LEAKS or self._pool_monitor is None:
+            return
+        leaked_connections = self._pool_monitor.release_leaked_connections()
+        if leaked_connections:
+            open_transactions = self._pool_monitor.stats.open_transactions
+            self.fail(
+                f'{leaked_connections} connections left checked out, {open_transactions} of them in transaction'
+            )
+
+    @classmethod
+    def get_tables(cls, required: Optional[List[RequiredTable]] = None) -> List[Table]:
+        """Tables of `DECLARATIVE_BASE` in dependency order, limited to required ones and tables they reference."""
+        sorted_tables = cls.DECLARATIVE_BASE.metadata.sorted_tables
+        required = cls.REQUIRED_TABLES if required is None else required
+        if not required:
+            return sorted_tables
+
+        # NOTE: Fixture tables are created even if not listed, otherwise seeded state can't be restored
+        tables_by_name = {table.name: table for table in sorted_tables}
+        names = [_get_table_name(item) for item in required]
+        pending = [tables_by_name[name] for name in names + cls._get_fixture_tables()]
+        closure: Set[Table] = set()
+        while pending:
+            table = pending.pop()
+            if table in closure:
+                continue
+            closure.add(table)
+            pending.extend(
+                foreign_key.column.table for foreign_key in table.foreign_keys
+            )
+        return [table for table in sorted_tables if table in closure]
+
+    def _get_test_tables(self) -> List[Table]:
+        test_method = getattr(self, self._testMethodName)
+        return self.get_tables(getattr(test_method, '__required_tables__', None))
+
+    @classmethod
+    def create_schema(cls, tables: Optional[List[Table]] = None) -> None:
+        if cls.DDL_WORKERS > 1:
+            create_all_parallel(
+                cls._get_engine(), tables or cls.get_tables(), cls.DDL_WORKERS
+            )
+        else:
+            cls.DECLARATIVE_BASE.metadata.create_all(
+                cls._get_engine(), tables=tables or cls.get_tables()
+            )
+
+    @classmethod
+    def drop_schema(cls, tables: Optional[List[Table]] = None) -> None:
+        if cls.DDL_WORKERS > 1:
+            drop_all_parallel(
+                cls._get_engine(), tables or cls.get_tables(), cls.DDL_WORKERS
+            )
+        else:
+            cls.DECLARATIVE_BASE.metadata.drop_all(
+                cls._get_engine(), tables=tables or cls.get_tables()
+            )
+        with cls.get_connection() as connection:
+            connection.execute(f'DROP TABLE IF EXISTS `{FINGERPRINT_TABLE}`')
+
+    @classmethod
+    def get_schema_fingerprint(cls) -> Optional[str]:
+        """Hash of DDL statements generated for tables created by test case."""
+        dialect = mysql.dialect()
+        statements = []
+        for table in cls.get_tables():
+            statements.append(str(CreateTable(table).compile(dialect=dialect)))
+            # NOTE: sqlalchemy-stubs declare element of `CreateIndex` as a string
+            for index in sorted(table.indexes, key=lambda i: i.name or ''):
+                create_index = CreateIndex(cast(Any, index))
+                statements.append(str(create_index.compile(dialect=dialect)))
+        return hash_strings(statements)
+
+    @classmethod
+    def build_schema(cls) -> bool:
+        """Create schema unless tables built from the same metadata are left by previous test case. Returns True if created."""
+        database, fingerprint = cls.get_config().database, cls.get_schema_fingerprint()
+        with cls._connect() as connection:
+            if (
+                fingerprint is not None
+                and read_fingerprint(connection, database) == fingerprint
+            ):
+                return False
+            drop_all_tables(connection, database)
+        cls.create_schema()
+        if fingerprint is not None:
+            with cls._connect() as connection:
+                write_fingerprint(connection, database, fingerprint)
+        return True
+
+    @classmethod
+    def truncate_schema(cls) -> None:
+        with cls._get_connection_without_foreign_key_checks() as connection:
+            for table in cls.get_tables():
+                connection.execute(f'TRUNCATE TABLE `{table.name}`')
+
+    @classmethod
+    def load_fixtures(cls) -> None:
+        """Insert fixture rows in chunks with `executemany`."""
+        with cls._get_connection_without_foreign_key_checks() as connection:
+            for fixture in cls.FIXTURES:
+                for statement, parameters in fixture.chunks():
+                    connection.execute(statement, parameters)
+
+    @classmethod
+    def generate_data(
+        cls,
+        rows: Dict[RequiredTable, int],
+        chunk_size: int = CHUNK_SIZE,
+        seed: int = 0,
+        use_numpy: Optional[bool] = None,  # pylint: disable=unsubscriptable-object
+    ) -> None:
+        """Insert synthetic rows into empty tables (names or models mapped to number of rows) in chunks with `executemany`."""
+        rows_by_name = {_get_table_name(table): count for table, count in rows.items()}
+        tables = [
+            get_table_spec(table, rows_by_name[table.name])
+            for table in cls.DECLARATIVE_BASE.metadata.sorted_tables
+            if table.name in rows_by_name
+        ]
+        with cls._get_connection_without_foreign_key_checks() as connection:
+            for statement, parameters in generate_chunks(
+                tables, chunk_size, seed, use_numpy=use_numpy
+            ):
+                connection.execute(statement, parameters)
+
+    @classmethod
+    def snapshot_fixtures(cls) -> None:
+        """Copy seeded tables to `FIXTURES_DATABASE`."""
+        database = cls.get_config().database
+        cls.recreate_database(cls.FIXTURES_DATABASE)
+        with cls.get_connection() as connection:
+            for table in cls._get_fixture_tables():
+                for statement in snapshot_statements(
+                    database, cls.FIXTURES_DATABASE, table
+                ):
+                    connection.execute(statement)
 
     @classmethod
-    def create_schema(cls) -> None:
-        cls.DECLARATIVE_BASE.metadata.create_all(cls._get_engine())
+    def restore_fixtures(cls) -> None:
+        """Copy seeded tables from `FIXTURES_DATABASE`. Tables must be empty."""
+        database = cls.get_config().database
+        with cls._get_connection_without_foreign_key_checks() as connection:
+            for table in cls._get_fixture_tables():
+                for statement in restore_statements(
+                    database, cls.FIXTURES_DATABASE, table
+                ):
+                    connection.execute(statement)
 
     @classmethod
-    def drop_schema(cls) -> None:
-        cls.DECLARATIVE_BASE.metadata.drop_all(cls._get_engine())
+    def _get_fixture_tables(cls) -> List[str]:
+        return list(dict.fromkeys(fixture.table for fixture in cls.FIXTURES))
+
+    @classmethod
+    @contextmanager
+    def _get_connection_without_foreign_key_checks(
+        cls,
+    ) -> Generator[Connection, None, None]:
+        with cls.get_connection() as connection:
+            connection.execute('SET FOREIGN_KEY_CHECKS = 0')
+            try:
+                yield connection
+            finally:
+                connection.execute('SET FOREIGN_KEY_CHECKS = 1')
 
     @classmethod
     @contextmanager
     def get_connection(cls) -> Generator[Connection, None, None]:
-        connection_factory = ConnectionFactory(cls.get_config())
+        if cls._isolation_connection is not None:
+            yield cls._isolation_connection
+            return
 
-        with connection_factory.create() as connection:
-            yield connection
+        connection_factory = ConnectionFactory(cls.get_config())
+        try:
+            with connection_factory.create() as connection:
+                yield connection
+        finally:
+            connection_factory.dispose()
 
     @classmethod
     @contextmanager
     def get_session(cls) -> Generator[Storage, None, None]:
+        if cls._isolation_connection is not None:
+            session = cls._create_isolated_session(Storage, cls._isolation_connection)
+            try:
+                yield session
+                session.commit()
+            except Exception as exc:
+                session.rollback()
+                raise exc
+            finally:
+                session.close()
+            return
+
         session_factory = SessionFactory[Storage](cls.get_config())
+        try:
+            with session_factory.create() as session:
+                yield session
+        finally:
+            session_factory.dispose()
 
-        with session_factory.create() as session:
-            yield session
+    @classmethod
+    def _create_isolated_session(
+        cls, storage_class: Type[TStorage], connection: Connection
+    ) -> TStorage:
+        """Create session which commits to a savepoint inside outer transaction of a given connection."""
+        session = storage_class(bind=connection, expire_on_commit=False)
+        session.begin_nested()
+
+        # NOTE: https://docs.sqlalchemy.org/en/13/orm/session_transaction.html#joining-a-session-into-an-external-transaction-such-as-for-test-suites
+        @event.listens_for(session, 'after_transaction_end')
+        def restart_savepoint(session, transaction):
+            if transaction.nested and not transaction._parent.nested:
+                session.expire_all()
+                session.begin_nested()
+
+        return session
+
+    @classmethod
+    @contextmanager
+    def capture_queries(cls) -> Generator[QueryLog, None, None]:
+        """Record statements executed by any engine, including ones used by `self.storage` and `get_session()`."""
+        queries = QueryLog()
+        start_times: Dict[int, float] = {}
+
+        def before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            start_times[id(cursor)] = time.perf_counter()
+
+        def after_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            start_time = start_times.pop(id(cursor), None)
+            if start_time is not None:
+                queries.add(statement, time.perf_counter() - start_time)
+
+        event.listen(Engine, 'before_cursor_execute', before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', after_cursor_execute)
+        try:
+            yield queries
+        finally:
+            event.remove(Engine, 'before_cursor_execute', before_cursor_execute)
+            event.remove(Engine, 'after_cursor_execute', after_cursor_execute)
 
     @classmethod
     def _get_engine(cls) -> Engine:
-        return sqlalchemy.create_engine(cls._get_connection_url())
+        return _watch_engine(sqlalchemy.create_engine(cls._get_connection_url()))
 
     @classmethod
     def recreate_database(cls, name: str) -> None:
@@ -201,12 +841,12 @@ class _SQLAlchemyAlembicTestCase(ABC, _SQLAlchemyTestCase):
     @classproperty
     def ALEMBIC_DATABASE(self) -> str:
         """Name of schema used for Alembic migrations."""
-        return 'test_alembic'
+        return get_worker_database('test_alembic')
 
     @classproperty
     def IGNORED_TABLES(self) -> Set[str]:
         """Set of table names ignored by all checks."""
-        return {'alembic_version'}
+        return {'alembic_version', FINGERPRINT_TABLE}
 
     # Internal attributes for typehinting
     config: DatabaseConfig
@@ -252,6 +892,9 @@ class _SQLAlchemyAlembicTestCase(ABC, _SQLAlchemyTestCase):
 
     @classmethod
     def create_alembic_schema(cls) -> None:
+        import alembic.command  # type: ignore
+        import alembic.config  # type: ignore
+
         alembic_config = alembic.config.Config(
             os.path.join(cls.PROJECT_PATH, cls.ALEMBIC_CONFIG_PATH)
         )
@@ -264,28 +907,43 @@ class _SQLAlchemyAlembicTestCase(ABC, _SQLAlchemyTestCase):
         alembic.command.upgrade(alembic_config, "head")
 
     @classmethod
-    def setUpClass(cls) -> None:
-        super().setUpClass()
+    def build_alembic_schema(cls) -> bool:
+        """Apply migrations unless they were applied from the same revision files before. Returns True if applied."""
+        fingerprint = files_fingerprint(
+            [
+                os.path.join(cls.PROJECT_PATH, cls.ALEMBIC_PATH),
+                os.path.join(cls.PROJECT_PATH, cls.ALEMBIC_CONFIG_PATH),
+            ]
+        )
+        with cls._connect() as connection:
+            if read_fingerprint(connection, cls.ALEMBIC_DATABASE) == fingerprint:
+                return False
         cls.recreate_database(cls.ALEMBIC_DATABASE)
-        cls.create_schema()
         cls.create_alembic_schema()
+        with cls._connect() as connection:
+            write_fingerprint(connection, cls.ALEMBIC_DATABASE, fingerprint)
+        return True
 
+    # NOTE: Both schemas are left in place, so they are reused by other test cases with the same fingerprints.
     @classmethod
-    def tearDownClass(cls) -> None:
-        super().tearDownClass()
-        cls.recreate_database(cls.ALEMBIC_DATABASE)
-        cls.drop_schema()
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.build_schema()
+        cls.build_alembic_schema()
+
+    def _get_storage_tables(self) -> Set[str]:
+        return set(self.storage_inspector.get_table_names()) - self.IGNORED_TABLES
 
     def test_tables_are_equal(self) -> None:
         alembic_tables = (
             set(self.alembic_inspector.get_table_names()) - self.IGNORED_TABLES
         )
-        storage_tables = set(self.storage_inspector.get_table_names())
+        storage_tables = self._get_storage_tables()
 
         self.assertSetEqual(alembic_tables, storage_tables)
 
     def test_table_options_are_equal(self) -> None:
-        storage_tables = set(self.storage_inspector.get_table_names())
+        storage_tables = self._get_storage_tables()
 
         for table in storage_tables:
             alembic_options = self.alembic_inspector.get_table_options(table)
@@ -294,7 +952,7 @@ class _SQLAlchemyAlembicTestCase(ABC, _SQLAlchemyTestCase):
             self.assertDictEqual(alembic_options, storage_options)
 
     def test_columns_are_equal(self) -> None:
-        storage_tables = set(self.storage_inspector.get_table_names())
+        storage_tables = self._get_storage_tables()
 
         for table in storage_tables:
             alembic_columns = sorted(
@@ -323,7 +981,7 @@ class _SQLAlchemyAlembicTestCase(ABC, _SQLAlchemyTestCase):
                 )
 
     def test_foreign_keys_are_equal(self) -> None:
-        storage_tables = set(self.storage_inspector.get_table_names())
+        storage_tables = self._get_storage_tables()
 
         for table in storage_tables:
             alembic_fks = sorted(
@@ -344,7 +1002,7 @@ class _SQLAlchemyAlembicTestCase(ABC, _SQLAlchemyTestCase):
             self.assertListEqual(alembic_fks, storage_fks)
 
     def test_indexes_are_equal(self) -> None:
-        storage_tables = set(self.storage_inspector.get_table_names())
+        storage_tables = self._get_storage_tables()
 
         for table in storage_tables:
             alembic_indexes = sorted(
@@ -361,7 +1019,7 @@ class _SQLAlchemyAlembicTestCase(ABC, _SQLAlchemyTestCase):
             )
 
     def test_pk_constraints_are_equal(self) -> None:
-        storage_tables = set(self.storage_inspector.get_table_names())
+        storage_tables = self._get_storage_tables()
 
         for table in storage_tables:
             alembic_pk_constraint = self.alembic_inspector.get_pk_constraint(table)
@@ -374,7 +1032,7 @@ class _SQLAlchemyAlembicTestCase(ABC, _SQLAlchemyTestCase):
             )
 
     def test_unique_constraints_are_equal(self) -> None:
-        storage_tables = set(self.storage_inspector.get_table_names())
+        storage_tables = self._get_storage_tables()
 
         for table in storage_tables:
             alembic_unique_constraints = sorted(
@@ -0,0 +1,216 @@
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
+from typing import Dict
+from typing import Generic
+from typing import Optional
+from typing import Type
+from typing import TypeVar
+from unittest import IsolatedAsyncioTestCase
+
+from sqlalchemy import event  # type: ignore
+
+from testcontainers_orm.config import DatabaseConfig
+from testcontainers_orm.sqlalchemy import _SQLAlchemyTestCase
+from testcontainers_orm.utils import classproperty
+
+# NOTE: Requires SQLAlchemy 1.4+ with asyncio extension and aiomysql driver, package itself supports SQLAlchemy 1.3.
+try:
+    from sqlalchemy.ext.asyncio import AsyncConnection  # type: ignore
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio import AsyncTransaction
+    from sqlalchemy.ext.asyncio import create_async_engine
+except ImportError as exc:
+    raise ImportError(
+        'testcontainers_orm.sqlalchemy_async requires SQLAlchemy 1.4+ with asyncio extension'
+    ) from exc
+
+# NOTE: Engines are shared by all factories and test cases, so dialect initialization and compiled statement cache
+# NOTE: are reused. Connections are bound to event loop of a test, so pools are disposed after each test.
+_engines: Dict[str, AsyncEngine] = {}
+
+
+class AsyncStorage(AsyncSession):
+    ...
+
+
+TAsyncStorage = TypeVar('TAsyncStorage', bound=AsyncStorage)
+
+
+def get_async_engine(config: DatabaseConfig) -> AsyncEngine:
+    """Return engine for a given connection URL, creating it on first call."""
+    if config.driver in ('mysql', 'mysql+pymysql'):
+        config.driver = 'mysql+aiomysql'
+    connection_string = config.connection_string
+    if connection_string not in _engines:
+        _engines[connection_string] = create_async_engine(
+            connection_string,
+            echo=config.echo,
+            isolation_level=config.isolation_level,
+            pool_recycle=config.pool_recycle,
+            pool_pre_ping=config.pool_pre_ping,
+        )
+    return _engines[connection_string]
+
+
+async def dispose_async_engines() -> None:
+    """Close pooled connections of all engines. Must be called before event loop they were created in is closed."""
+    for engine in _engines.values():
+        await engine.dispose()
+
+
+class AsyncEngineFactory(Generic[TAsyncStorage]):
+    def __init__(self, config: DatabaseConfig) -> None:
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self._config: DatabaseConfig = config
+
+    def _get_engine(self) -> AsyncEngine:
+        return get_async_engine(self._config)
+
+
+class AsyncConnectionFactory(AsyncEngineFactory):
+    @asynccontextmanager
+    async def create(self) -> AsyncGenerator[AsyncConnection, None]:
+        async with self._get_engine().connect() as connection:
+            yield connection
+
+
+class AsyncSessionFactory(AsyncEngineFactory[TAsyncStorage]):
+    def _get_storage_class(self) -> Type[TAsyncStorage]:
+        import typing_inspect  # type: ignore
+
+        generic_type = typing_inspect.get_generic_type(self)
+        type_parameters = typing_inspect.get_args(generic_type)
+        return type_parameters[0]
+
+    def _create_session(self) -> TAsyncStorage:
+        storage_class = self._get_storage_class()
+        return storage_class(bind=self._get_engine(), expire_on_commit=False)
+
+    @asynccontextmanager
+    async def create(self) -> AsyncGenerator[TAsyncStorage, None]:
+        session = self._create_session()
+        try:
+            yield session
+            await session.commit()
+        except Exception as exc:
+            await session.rollback()
+            raise exc
+        finally:
+            await session.close()
+
+
+# NOTE: This class left private intentionally. Otherwise it will be discovered by nosetests.
+class _AsyncSQLAlchemyTestCase(_SQLAlchemyTestCase, IsolatedAsyncioTestCase):
+    """SQLAlchemyTestCase for code using asyncio extension.
+
+    Schema and fixtures are managed the same way as in SQLAlchemyTestCase using sync engine.
+    """
+
+    @classproperty
+    def ASYNC_STORAGE_CLASS(self) -> Type[AsyncStorage]:
+        """Class of `self.storage` session."""
+        return AsyncStorage
+
+    # Strategy used to isolate tests from each other:
+    # 'rollback' - `self.storage`, `get_async_session()` and `get_async_connection()` share a single async connection
+    #              with outer transaction which is rolled back after each test
+    # 'truncate' - every session and connection is checked out from shared engine, so code paths can run concurrently;
+    #              tables are truncated after each test
+    # 'drop_create' - same as 'truncate', but schema is created before and dropped after each test
+    ISOLATION = 'rollback'
+
+    # Internal attributes for typehinting
+    storage: AsyncStorage  # type: ignore
+    _async_connection: Optional[AsyncConnection] = None
+    _async_transaction: Optional[AsyncTransaction] = None
+
+    # NOTE: Sync session is not created, isolation transaction is started on async connection in asyncSetUp
+    def run(self, result=None):
+        return super(_SQLAlchemyTestCase, self).run(result)
+
+    def setUp(self) -> None:
+        if self.ISOLATION != 'rollback':
+            super().setUp()
+
+    def tearDown(self) -> None:
+        if self.ISOLATION != 'rollback':
+            super().tearDown()
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        if self.ISOLATION == 'rollback':
+            connection = await get_async_engine(self.get_config()).connect()
+            type(self)._async_connection = connection
+            self._async_transaction = await connection.begin()
+            self.storage = await self._create_isolated_async_session(
+                self.ASYNC_STORAGE_CLASS, connection
+            )
+        else:
+            self.storage = self._create_async_session(self.ASYNC_STORAGE_CLASS)
+
+    async def asyncTearDown(self) -> None:
+        try:
+            await self.storage.close()
+            del self.storage
+            connection, transaction = self._async_connection, self._async_transaction
+            type(self)._async_connection, self._async_transaction = None, None
+            if transaction is not None:
+                await transaction.rollback()
+            if connection is not None:
+                await connection.close()
+        finally:
+            await dispose_async_engines()
+        await super().asyncTearDown()
+
+    @classmethod
+    @asynccontextmanager
+    async def get_async_connection(cls) -> AsyncGenerator[AsyncConnection, None]:
+        if cls._async_connection is not None:
+            yield cls._async_connection
+            return
+
+        async with AsyncConnectionFactory(cls.get_config()).create() as connection:
+            yield connection
+
+    @classmethod
+    @asynccontextmanager
+    async def get_async_session(cls) -> AsyncGenerator[AsyncStorage, None]:
+        if cls._async_connection is not None:
+            session = await cls._create_isolated_async_session(
+                AsyncStorage, cls._async_connection
+            )
+        else:
+            session = cls._create_async_session(AsyncStorage)
+        try:
+            yield session
+            await session.commit()
+        except Exception as exc:
+            await session.rollback()
+            raise exc
+        finally:
+            await session.close()
+
+    @classmethod
+    def _create_async_session(cls, storage_class: Type[TAsyncStorage]) -> TAsyncStorage:
+        return storage_class(
+            bind=get_async_engine(cls.get_config()), expire_on_commit=False
+        )
+
+    @classmethod
+    async def _create_isolated_async_session(
+        cls, storage_class: Type[TAsyncStorage], connection: AsyncConnection
+    ) -> TAsyncStorage:
+        """Create session which commits to a savepoint inside outer transaction of a given connection."""
+        session = storage_class(bind=connection, expire_on_commit=False)
+        await session.begin_nested()
+
+        # NOTE: Same recipe as in `_create_isolated_session`, events are emitted by sync session behind async one
+        @event.listens_for(session.sync_session, 'after_transaction_end')
+        def restart_savepoint(session, transaction):
+            if transaction.nested and not transaction._parent.nested:
+                session.expire_all()
+                session.begin_nested()
+
+        return session
@@ -0,0 +1,301 @@
+import json
+import random
+import string
+import uuid
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from testcontainers_orm.fixtures import CHUNK_SIZE
+from testcontainers_orm.fixtures import insert_statement
+
+# NOTE: Fits both DATETIME and TIMESTAMP ranges
+MIN_DATETIME = datetime(2001, 1, 1)
+DATETIME_SPAN = 30 * 365 * 24 * 3600
+
+# NOTE: Fits signed INT
+DEFAULT_MAX_INT = 2 ** 31 - 1
+DEFAULT_STRING_LENGTH = 32
+# NOTE: Random strings are sampled from a pool instead of being generated for every value
+STRING_POOL_SIZE = 4096
+# NOTE: Unique strings are sequential numbers in base 36, case-insensitive collations don't make them collide
+UNIQUE_STRING_ALPHABET = string.digits + string.ascii_lowercase
+
+# NOTE: Types which can be generated unique without knowing anything but number of rows
+_SEQUENTIAL_TYPES = (int, str, float, Decimal)
+
+
+@dataclass
+class ColumnSpec:
+    """Column of generated table. Values are generated by Python type of a column."""
+
+    name: str
+    python_type: type
+    nullable: bool = False
+    unique: bool = False
+    primary_key: bool = False
+    length: Optional[int] = None  # pylint: disable=unsubscriptable-object
+    precision: Optional[int] = None  # pylint: disable=unsubscriptable-object
+    scale: Optional[int] = None  # pylint: disable=unsubscriptable-object
+    max_value: Optional[int] = None  # pylint: disable=unsubscriptable-object
+    choices: Sequence[Any] = ()
+    # NOTE: Name of referenced table, its primary key is expected to be generated too
+    references: Optional[str] = None  # pylint: disable=unsubscriptable-object
+
+
+@dataclass
+class TableSpec:
+    name: str
+    rows: int
+    columns: List[ColumnSpec] = field(default_factory=list)
+
+
+def mark_unique_together(columns: Sequence[ColumnSpec], names: Sequence[str]) -> None:
+    """Make a combination of columns unique (composite unique constraint or index) by making one of them unique."""
+    group = [column for column in columns if column.name in names]
+    if not group or any(column.unique for column in group):
+        return
+    sequential = [
+        column
+        for column in group
+        if column.python_type in _SEQUENTIAL_TYPES
+        and column.references is None
+        and not column.choices
+    ]
+    (sequential or group)[0].unique = True
+
+
+def generate_chunks(
+    tables: Sequence[TableSpec],
+    chunk_size: int = CHUNK_SIZE,
+    seed: int = 0,
+    null_fraction: float = 0.1,
+    use_numpy: Optional[bool] = None,  # pylint: disable=unsubscriptable-object
+) -> Iterator[Tuple[str, List[Tuple[Any, ...]]]]:
+    """Yield INSERT statement with lists of parameters for `executemany` calls, generated column by column.
+
+    Tables must be ordered by dependencies and empty. Primary keys are sequential integers starting from 1, so foreign
+    keys are sampled from the range of referenced table. Only one chunk of rows is kept in memory.
+    Random values are generated with vectorized numpy calls if numpy is installed, unless `use_numpy` is `False`;
+    output differs from the pure Python one.
+    """
+    rng = random.Random(seed)
+    rows_by_table: Dict[str, int] = {table.name: table.rows for table in tables}
+    numpy_rng = _create_numpy_rng(seed, use_numpy) if use_numpy is not False else None
+    for table in tables:
+        generator = (
+            _NumpyTableGenerator(table, rows_by_table, rng, null_fraction, numpy_rng)
+            if numpy_rng is not None
+            else _TableGenerator(table, rows_by_table, rng, null_fraction)
+        )
+        statement = insert_statement(
+            table.name, [column.name for column in table.columns]
+        )
+        for start in range(0, table.rows, chunk_size):
+            size = min(chunk_size, table.rows - start)
+            columns = [
+                generator.generate(column, start, size) for column in table.columns
+            ]
+            yield statement, list(zip(*columns))
+
+
+class _TableGenerator:
+    def __init__(
+        self,
+        table: TableSpec,
+        rows_by_table: Dict[str, int],
+        rng: random.Random,
+        null_fraction: float,
+    ) -> None:
+        self._table = table
+        self._rows_by_table = rows_by_table
+        self._rng = rng
+        self._null_fraction = null_fraction
+        self._string_pools: Dict[int, List[str]] = {}
+
+    def generate(self, column: ColumnSpec, start: int, size: int) -> List[Any]:
+        values = self._generate_values(column, start, size)
+        if column.nullable and not column.unique and self._null_fraction:
+            values = [
+                None if is_null else value
+                for value, is_null in zip(values, self._generate_null_mask(size))
+            ]
+        return values
+
+    def _generate_null_mask(self, size: int) -> List[bool]:
+        rng, null_fraction = self._rng, self._null_fraction
+        return [rng.random() < null_fraction for _ in range(size)]
+
+    def _generate_values(self, column: ColumnSpec, start: int, size: int) -> List[Any]:
+        rng = self._rng
+        sequence = range(start + 1, start + size + 1)
+
+        if column.references is not None:
+            referenced_rows = self._rows_by_table.get(column.references)
+            if not referenced_rows:
+                if column.nullable:
+                    return [None] * size
+                raise ValueError(
+                    f'`{self._table.name}.{column.name}` references `{column.references}` table which is not generated'
+                )
+            if column.unique:
+                if self._table.rows > referenced_rows:
+                    raise ValueError(
+                        f'Not enough rows in `{column.references}` for unique `{self._table.name}.{column.name}`'
+                    )
+                return list(sequence)
+            return [rng.randint(1, referenced_rows) for _ in range(size)]
+
+        python_type = column.python_type
+        if column.choices:
+            if column.unique:
+                raise ValueError(
+                    f'Unable to generate unique values of `{self._table.name}.{column.name}` from choices'
+                )
+            return rng.choices(column.choices, k=size)
+        if python_type is bool:
+            return [bool(rng.getrandbits(1)) for _ in range(size)]
+        if python_type is int:
+            if column.primary_key or column.unique:
+                return list(sequence)
+            max_value = column.max_value or DEFAULT_MAX_INT
+            return [rng.randint(0, max_value) for _ in range(size)]
+        if python_type is float:
+            if column.unique:
+                return [float(value) for value in sequence]
+            return [rng.random() * 1000 for _ in range(size)]
+        if python_type is Decimal:
+            precision, scale = column.precision or 10, column.scale or 0
+            if column.unique:
+                return [Decimal(value).scaleb(-scale) for value in sequence]
+            limit = 10 ** (precision - 1)
+            return [Decimal(rng.randrange(limit)).scaleb(-scale) for _ in range(size)]
+        if python_type is str:
+            length = column.length or DEFAULT_STRING_LENGTH
+            if column.unique:
+                if len(_encode_unique_string(max(self._table.rows - 1, 0))) > length:
+                    raise ValueError(
+                        f'`{self._table.name}.{column.name}` is too short for {self._table.rows} unique values'
+                    )
+                return [_encode_unique_string(value - 1) for value in sequence]
+            return rng.choices(self._get_string_pool(length), k=size)
+        if python_type is datetime:
+            return [
+                MIN_DATETIME + timedelta(seconds=rng.randrange(DATETIME_SPAN))
+                for _ in range(size)
+            ]
+        if python_type is date:
+            return [
+                MIN_DATETIME.date()
+                + timedelta(days=rng.randrange(DATETIME_SPAN // 86400))
+                for _ in range(size)
+            ]
+        if python_type is dict:
+            return [json.dumps({'value': value}) for value in sequence]
+        if python_type is bytes:
+            length = min(column.length or 16, 16)
+            return [
+                rng.getrandbits(length * 8).to_bytes(length, 'big') for _ in range(size)
+            ]
+        if python_type is uuid.UUID:
+            return [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(size)]
+
+        if column.nullable:
+            return [None] * size
+        raise ValueError(
+            f'Unable to generate values of `{self._table.name}.{column.name}` of type {python_type}'
+        )
+
+    def _get_string_pool(self, length: int) -> List[str]:
+        if length not in self._string_pools:
+            alphabet = string.ascii_letters + string.digits
+            self._string_pools[length] = [
+                ''.join(self._rng.choices(alphabet, k=self._rng.randint(1, length)))
+                for _ in range(STRING_POOL_SIZE)
+            ]
+        return self._string_pools[length]
+
+
+class _NumpyTableGenerator(_TableGenerator):
+    """Same as `_TableGenerator`, but random numbers, references, choices and null masks are generated by numpy."""
+
+    def __init__(
+        self,
+        table: TableSpec,
+        rows_by_table: Dict[str, int],
+        rng: random.Random,
+        null_fraction: float,
+        numpy_rng: Any,
+    ) -> None:
+        super().__init__(table, rows_by_table, rng, null_fraction)
+        self._numpy_rng = numpy_rng
+
+    def _generate_null_mask(self, size: int) -> List[bool]:
+        return (self._numpy_rng.random(size) < self._null_fraction).tolist()
+
+    def _generate_values(self, column: ColumnSpec, start: int, size: int) -> List[Any]:
+        # NOTE: Unique values are sequential, they don't need random numbers
+        if column.unique:
+            return super()._generate_values(column, start, size)
+
+        rng = self._numpy_rng
+        python_type = column.python_type
+        referenced_rows = self._rows_by_table.get(column.references or '')
+        if column.references is not None and referenced_rows:
+            return rng.integers(1, referenced_rows, size, endpoint=True).tolist()
+        if column.references is None:
+            if column.choices:
+                return self._sample(column.choices, size)
+            if python_type is bool:
+                return rng.integers(0, 2, size).astype(bool).tolist()
+            if python_type is int:
+                max_value = column.max_value or DEFAULT_MAX_INT
+                return rng.integers(0, max_value, size, endpoint=True).tolist()
+            if python_type is float:
+                return (rng.random(size) * 1000).tolist()
+            if python_type is str:
+                length = column.length or DEFAULT_STRING_LENGTH
+                return self._sample(self._get_string_pool(length), size)
+            if python_type is datetime:
+                return [
+                    MIN_DATETIME + timedelta(seconds=seconds)
+                    for seconds in rng.integers(0, DATETIME_SPAN, size).tolist()
+                ]
+        return super()._generate_values(column, start, size)
+
+    def _sample(self, population: Sequence[Any], size: int) -> List[Any]:
+        indexes = self._numpy_rng.integers(0, len(population), size).tolist()
+        return [population[index] for index in indexes]
+
+
+def _create_numpy_rng(
+    seed: int, required: Optional[bool]
+) -> Any:  # pylint: disable=unsubscriptable-object
+    """Numpy random generator, `None` if numpy is not installed and it's not `required`."""
+    try:
+        import numpy  # type: ignore
+    except ImportError as exc:
+        if required:
+            raise ImportError('`use_numpy` option requires numpy') from exc
+        return None
+    return numpy.random.default_rng(seed)
+
+
+def _encode_unique_string(value: int) -> str:
+    base = len(UNIQUE_STRING_ALPHABET)
+    digits = []
+    while True:
+        value, digit = divmod(value, base)
+        digits.append(UNIQUE_STRING_ALPHABET[digit])
+        if not value:
+            return ''.join(reversed(digits))
@@ -1,17 +1,44 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from contextlib import contextmanager
+from dataclasses import asdict
 from datetime import datetime
 from datetime import timezone
+from functools import wraps
 from typing import Any
+from typing import AsyncGenerator
+from typing import Callable
+from typing import Dict
+from typing import Generator
+from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Type
 from unittest import IsolatedAsyncioTestCase
 
 from tortoise import Tortoise  # type: ignore
 from tortoise import fields
+from tortoise.models import Model  # type: ignore
 from tortoise.transactions import in_transaction  # type: ignore
 
 from testcontainers_orm.config import DatabaseConfig
+from testcontainers_orm.connections import PoolMonitor
+from testcontainers_orm.connections import PoolStats
 from testcontainers_orm.database import _MySQLDatabaseTestCase
-from testcontainers_orm.sqlalchemy import _SQLAlchemyAlembicTestCase
-from testcontainers_orm.sqlalchemy import _SQLAlchemyTestCase
+from testcontainers_orm.ddl import topological_levels
+from testcontainers_orm.fixtures import CHUNK_SIZE
+from testcontainers_orm.fixtures import Fixture
+from testcontainers_orm.fixtures import restore_statements
+from testcontainers_orm.fixtures import snapshot_statements
+from testcontainers_orm.queries import QueryLog
+from testcontainers_orm.report import report
+from testcontainers_orm.sharding import get_worker_database
+from testcontainers_orm.synthetic import ColumnSpec
+from testcontainers_orm.synthetic import TableSpec
+from testcontainers_orm.synthetic import generate_chunks
+from testcontainers_orm.synthetic import mark_unique_together
+from testcontainers_orm.utils import check_isolation
 from testcontainers_orm.utils import classproperty
 
 
@@ -48,6 +75,134 @@ class TimestampField(fields.DatetimeField):
         return data
 
 
+_EXECUTE_METHODS = ('execute_insert', 'execute_many', 'execute_query', 'execute_script')
+
+ISOLATION_STRATEGIES = ('drop_create', 'truncate')
+
+
+class TortoisePoolMonitor(PoolMonitor):
+    """Collects usage of aiomysql pools Tortoise MySQL clients and transactions acquire connections from."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._originals: Optional[
+            Tuple[Callable, Callable]
+        ] = None  # pylint: disable=unsubscriptable-object
+
+    def start(self) -> None:
+        from aiomysql import Pool  # type: ignore
+
+        monitor = self
+        acquire, release = Pool._acquire, Pool.release
+        self._originals = (acquire, release)
+
+        async def acquire_wrapper(pool):
+            start_time = time.perf_counter()
+            connection = await acquire(pool)
+            monitor.checkout(
+                id(connection), (pool, connection), time.perf_counter() - start_time
+            )
+            return connection
+
+        def release_wrapper(pool, connection):
+            monitor.checkin(id(connection))
+            return release(pool, connection)
+
+        Pool._acquire = acquire_wrapper
+        Pool.release = release_wrapper
+
+    def stop(self) -> None:
+        from aiomysql import Pool  # type: ignore
+
+        if self._originals is not None:
+            Pool._acquire, Pool.release = self._originals
+            self._originals = None
+
+    def _in_transaction(self, key: int, connection: Any) -> bool:
+        _, mysql_connection = connection
+        return mysql_connection.get_transaction_status()
+
+    def _release(self, connection: Any) -> None:
+        # NOTE: Closed connections are dropped from pool instead of being returned, so `close_connections` won't hang
+        pool, mysql_connection = connection
+        mysql_connection.close()
+        pool.release(mysql_connection)
+
+
+async def generate_schemas_parallel(safe: bool, workers: int) -> None:
+    """Same as `Tortoise.generate_schemas`, but independent tables are created concurrently using pooled connections."""
+    semaphore = asyncio.Semaphore(workers)
+
+    async def execute_script(client: Any, script: str) -> None:
+        async with semaphore:
+            await client.execute_script(script)
+
+    for client in Tortoise._connections.values():
+        # NOTE: Same statements as `get_schema_sql` generates, but grouped by table
+        generator = client.schema_generator(client)
+        models: List[Any] = []
+        generator._get_models_to_create(models)
+        tables = [generator._get_table_sql(model, safe) for model in models]
+        for level in topological_levels(
+            tables, lambda table: table['table'], lambda table: table['references']
+        ):
+            await asyncio.gather(
+                *(
+                    execute_script(client, table['table_creation_string'])
+                    for table in level
+                )
+            )
+        await asyncio.gather(
+            *(
+                execute_script(client, m2m_table)
+                for table in tables
+                for m2m_table in table['m2m_tables']
+            )
+        )
+
+
+def get_model_table_spec(model: Type[Model], rows: int) -> TableSpec:
+    """Describe table of a model for synthetic data generator."""
+    columns = []
+    for field_name, column_name in model._meta.fields_db_projection.items():
+        field = model._meta.fields_map[field_name]
+        # NOTE: Type of JSON field is a union of dict and list, values are generated as dicts
+        python_type: type = field.field_type
+        if isinstance(field, fields.JSONField):
+            python_type = dict
+        enum_type = getattr(field, 'enum_type', None)
+        reference = getattr(field, 'reference', None)
+        columns.append(
+            ColumnSpec(
+                name=column_name,
+                python_type=python_type,
+                nullable=field.null,
+                unique=field.unique or field.pk,
+                primary_key=field.pk,
+                length=getattr(field, 'max_length', None),
+                precision=getattr(field, 'max_digits', None),
+                scale=getattr(field, 'decimal_places', None),
+                max_value=field.constraints.get('le'),
+                choices=[member.value for member in enum_type] if enum_type else (),
+                references=reference.related_model._meta.db_table
+                if reference
+                else None,
+            )
+        )
+    # NOTE: Foreign keys are listed by relation names, their columns belong to source fields
+    projection = model._meta.fields_db_projection
+    for field_names in model._meta.unique_together:
+        mark_unique_together(
+            columns,
+            [
+                projection.get(name)
+                or projection[model._meta.fields_map[name].source_field or name]
+                for name in field_names
+            ],
+        )
+    return TableSpec(model._meta.db_table, rows, columns)
+
+
 # NOTE: This class left private intentionally. Otherwise it will be discovered by nosetests.
 class _TortoiseTestCase(_MySQLDatabaseTestCase, IsolatedAsyncioTestCase):
     @classproperty
@@ -55,6 +210,67 @@ class _TortoiseTestCase(_MySQLDatabaseTestCase, IsolatedAsyncioTestCase):
         """Qualified name of module containing Tortoise models (usually project.storage.models)."""
         raise NotImplementedError
 
+    @classproperty
+    def FIXTURES(self) -> List[Fixture]:
+        """Rows loaded once per class. Seeded state is restored before each test instead of loading fixtures again."""
+        return []
+
+    @classproperty
+    def FIXTURES_DATABASE(self) -> str:
+        """Name of schema used to store snapshot of seeded tables."""
+        return get_worker_database('test_fixtures')
+
+    # Strategy used to isolate tests from each other:
+    # 'drop_create' - schema is created before and dropped after each test
+    # 'truncate' - schema is created once per class, tables are truncated after each test
+    ISOLATION = 'drop_create'
+
+    # Fail tests which leave pool connections acquired (or transactions open) after test is finished.
+    # NOTE: Every aiomysql pool of the process is checked and leaked connections are closed.
+    CHECK_CONNECTION_LEAKS = False
+
+    # Number of connections used to create tables independent of each other concurrently
+    DDL_WORKERS = 1
+
+    # Internal attributes for typehinting
+    tortoise_pool_stats: Optional[PoolStats] = None
+    _tortoise_pool_monitor: Optional[TortoisePoolMonitor] = None
+    _fixtures_snapshotted = False
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        check_isolation(cls.ISOLATION, ISOLATION_STRATEGIES)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        if cls.ISOLATION == 'truncate' or cls._fixtures_snapshotted:
+
+            async def tear_down() -> None:
+                await cls.drop_tortoise_schema()
+                if cls._fixtures_snapshotted:
+                    async with in_transaction() as conn:
+                        await conn.execute_query(
+                            f'DROP DATABASE IF EXISTS `{cls.FIXTURES_DATABASE}`'
+                        )
+                    cls._fixtures_snapshotted = False
+                await Tortoise.close_connections()
+
+            asyncio.run(tear_down())
+
+    def run(self, result=None):
+        self._tortoise_pool_monitor = TortoisePoolMonitor()
+        self._tortoise_pool_monitor.start()
+        try:
+            result = super().run(result)
+        finally:
+            self._tortoise_pool_monitor.stop()
+
+        self.tortoise_pool_stats = self._tortoise_pool_monitor.stats
+        report.add(self.id(), 'tortoise_pool', asdict(self.tortoise_pool_stats))
+        return result
+
     @classmethod
     def get_config(cls) -> DatabaseConfig:
         config = _MySQLDatabaseTestCase.get_config()
@@ -63,13 +279,16 @@ class _TortoiseTestCase(_MySQLDatabaseTestCase, IsolatedAsyncioTestCase):
 
     # NOTE: This method returns coroutine and thus should not override super().create_schema
     @classmethod
-    async def create_tortoise_schema(cls) -> None:
+    async def create_tortoise_schema(cls, safe: bool = False) -> None:
         Tortoise._inited = False
         await Tortoise.init(
             db_url=cls.get_config().connection_string,
             modules={'models': [cls.MODELS_MODULE]},
         )
-        await Tortoise.generate_schemas()
+        if cls.DDL_WORKERS > 1:
+            await generate_schemas_parallel(safe, cls.DDL_WORKERS)
+        else:
+            await Tortoise.generate_schemas(safe=safe)
 
     @classmethod
     async def drop_tortoise_schema(cls) -> None:
@@ -83,36 +302,178 @@ class _TortoiseTestCase(_MySQLDatabaseTestCase, IsolatedAsyncioTestCase):
             await conn.execute_query(f'''DROP SCHEMA {cls.get_config().database}''')
             await conn.execute_query(f'''CREATE SCHEMA {cls.get_config().database}''')
 
-    async def asyncSetUp(self) -> None:
-        await self.create_tortoise_schema()
+    @classmethod
+    async def truncate_tortoise_schema(cls) -> None:
+        tables = [
+            model._meta.db_table
+            for app in Tortoise.apps.values()
+            for model in app.values()
+        ]
+        async with cls._in_transaction_without_foreign_key_checks() as conn:
+            for table in tables:
+                await conn.execute_query(f'TRUNCATE TABLE `{table}`')
 
-    async def asyncTearDown(self) -> None:
-        await self.drop_tortoise_schema()
-        await Tortoise.close_connections()
+    @classmethod
+    async def load_tortoise_fixtures(cls) -> None:
+        """Insert fixture rows in chunks with `executemany`."""
+        async with cls._in_transaction_without_foreign_key_checks() as conn:
+            for fixture in cls.FIXTURES:
+                for statement, parameters in fixture.chunks():
+                    await conn.execute_many(statement, parameters)
 
+    @classmethod
+    async def generate_tortoise_data(
+        cls,
+        rows: Dict[Type[Model], int],
+        chunk_size: int = CHUNK_SIZE,
+        seed: int = 0,
+        use_numpy: Optional[bool] = None,  # pylint: disable=unsubscriptable-object
+    ) -> None:
+        """Insert synthetic rows into empty tables of models in chunks with `executemany`."""
+        models = [
+            model
+            for app in Tortoise.apps.values()
+            for model in app.values()
+            if model in rows
+        ]
+        levels = topological_levels(
+            models,
+            lambda model: model._meta.db_table,
+            lambda model: [
+                spec.references
+                for spec in get_model_table_spec(model, 0).columns
+                if spec.references
+            ],
+        )
+        tables = [
+            get_model_table_spec(model, rows[model])
+            for level in levels
+            for model in level
+        ]
+        async with cls._in_transaction_without_foreign_key_checks() as conn:
+            for statement, parameters in generate_chunks(
+                tables, chunk_size, seed, use_numpy=use_numpy
+            ):
+                await conn.execute_many(statement, parameters)
 
-# NOTE: This class left private intentionally. Otherwise it will be discovered by nosetests.
-class _AlembicTortoiseTestCase(_TortoiseTestCase, _SQLAlchemyAlembicTestCase):
-    """AlembicSQLAlchemyTestCase, but with Tortoise schema creation.
+    @classmethod
+    async def snapshot_tortoise_fixtures(cls) -> None:
+        """Copy seeded tables to `FIXTURES_DATABASE`."""
+        database = cls.get_config().database
+        async with in_transaction() as conn:
+            await conn.execute_query(
+                f'DROP DATABASE IF EXISTS `{cls.FIXTURES_DATABASE}`'
+            )
+            await conn.execute_query(f'CREATE DATABASE `{cls.FIXTURES_DATABASE}`')
+            for table in cls._get_fixture_tables():
+                for statement in snapshot_statements(
+                    database, cls.FIXTURES_DATABASE, table
+                ):
+                    await conn.execute_query(statement)
 
-    SQLAlchemy class is reused as we use Alembic instead of Tortoise native migrations for consistency among projects.
-    """
+    @classmethod
+    async def restore_tortoise_fixtures(cls) -> None:
+        """Copy seeded tables from `FIXTURES_DATABASE`. Tables must be empty."""
+        database = cls.get_config().database
+        async with cls._in_transaction_without_foreign_key_checks() as conn:
+            for table in cls._get_fixture_tables():
+                for statement in restore_statements(
+                    database, cls.FIXTURES_DATABASE, table
+                ):
+                    await conn.execute_query(statement)
 
     @classmethod
-    def setUpClass(cls) -> None:
-        _SQLAlchemyTestCase.setUpClass()
-        cls.recreate_database(cls.ALEMBIC_DATABASE)
-        cls.create_alembic_schema()
+    def _get_fixture_tables(cls) -> List[str]:
+        return list(dict.fromkeys(fixture.table for fixture in cls.FIXTURES))
 
     @classmethod
-    def tearDownClass(cls) -> None:
-        _SQLAlchemyTestCase.tearDownClass()
-        cls.recreate_database(cls.ALEMBIC_DATABASE)
+    @asynccontextmanager
+    async def _in_transaction_without_foreign_key_checks(
+        cls,
+    ) -> AsyncGenerator[Any, None]:
+        # NOTE: Transaction is used to execute all statements on the same connection. DDL statements commit it implicitly.
+        async with in_transaction() as conn:
+            await conn.execute_query('SET FOREIGN_KEY_CHECKS = 0')
+            try:
+                yield conn
+            finally:
+                await conn.execute_query('SET FOREIGN_KEY_CHECKS = 1')
+
+    @classmethod
+    @contextmanager
+    def capture_queries(cls) -> Generator[QueryLog, None, None]:
+        """Record statements executed by Tortoise MySQL clients, including ones executed inside transactions."""
+        from tortoise.backends.mysql.client import MySQLClient  # type: ignore
+        from tortoise.backends.mysql.client import TransactionWrapper  # type: ignore
+
+        queries = QueryLog()
+        originals = []
+
+        def wrap(method):
+            @wraps(method)
+            async def wrapper(self, query, *args, **kwargs):
+                start_time = time.perf_counter()
+                result = await method(self, query, *args, **kwargs)
+                queries.add(query, time.perf_counter() - start_time)
+                return result
+
+            return wrapper
+
+        # NOTE: TransactionWrapper inherits everything from MySQLClient except `execute_many`
+        for client_class in (MySQLClient, TransactionWrapper):
+            for name in _EXECUTE_METHODS:
+                if name in vars(client_class):
+                    method = vars(client_class)[name]
+                    originals.append((client_class, name, method))
+                    setattr(client_class, name, wrap(method))
+        try:
+            yield queries
+        finally:
+            for client_class, name, method in originals:
+                setattr(client_class, name, method)
+
+    async def asyncSetUp(self) -> None:
+        # NOTE: Tortoise connections are closed after each test, so it has to be initialized anyway
+        await self.create_tortoise_schema(safe=self.ISOLATION == 'truncate')
+        if self.FIXTURES:
+            if not self._fixtures_snapshotted:
+                await self.load_tortoise_fixtures()
+                await self.snapshot_tortoise_fixtures()
+                type(self)._fixtures_snapshotted = True
+            elif self.ISOLATION != 'truncate':
+                await self.restore_tortoise_fixtures()
+
+    async def asyncTearDown(self) -> None:
+        try:
+            self.assertNoConnectionLeaks()
+        finally:
+            if self.ISOLATION == 'truncate':
+                await self.truncate_tortoise_schema()
+                if self.FIXTURES:
+                    await self.restore_tortoise_fixtures()
+            else:
+                await self.drop_tortoise_schema()
+            await Tortoise.close_connections()
+
+    def assertNoConnectionLeaks(self) -> None:
+        """Check that every connection acquired during the test is released back to its pool.
+
+        Leaked connections are closed before failing, so they don't block dropping the schema.
+        """
+        if not self.CHECK_CONNECTION_LEAKS or self._tortoise_pool_monitor is None:
+            return
+        leaked_connections = self._tortoise_pool_monitor.release_leaked_connections()
+        if leaked_connections:
+            open_transactions = self._tortoise_pool_monitor.stats.open_transactions
+            self.fail(
+                f'{leaked_connections} connections left acquired, {open_transactions} of them in transaction'
+            )
+
 
-    # FIXME: Tortoise generates random index names on schema creation. Skip this test for now.
-    def test_indexes_are_equal(self) -> None:
-        pass
+def __getattr__(name: str) -> Any:
+    # NOTE: Alembic test case requires SQLAlchemy and Alembic, so it's imported only when requested.
+    if name == '_AlembicTortoiseTestCase':
+        from testcontainers_orm.tortoise_alembic import _AlembicTortoiseTestCase
 
-    # FIXME: Tortoise creates tables with correct charset, however alembic always returns latin1 as a default one.
-    def test_table_options_are_equal(self) -> None:
-        pass
+        return _AlembicTortoiseTestCase
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
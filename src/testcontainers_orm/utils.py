@@ -1,3 +1,6 @@
+from typing import Sequence
+
+
 class classproperty(property):
     def __init__(self, fget, *arg, **kw):
         super(classproperty, self).__init__(fget, *arg, **kw)
@@ -5,3 +8,10 @@ class classproperty(property):
 
     def __get__(desc, self, cls):
         return desc.fget(cls)
+
+
+def check_isolation(isolation: str, strategies: Sequence[str]) -> None:
+    if isolation not in strategies:
+        raise ValueError(
+            f'Unknown isolation strategy `{isolation}`, expected one of: {", ".join(strategies)}'
+        )
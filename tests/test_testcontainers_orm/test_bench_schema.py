@@ -0,0 +1,22 @@
+import unittest
+
+from testcontainers_orm._bench_schema import generate_foreign_keys
+from testcontainers_orm._bench_schema import generate_metadata
+
+
+class GenerateMetadataTest(unittest.TestCase):
+    def test_foreign_keys_are_acyclic(self) -> None:
+        foreign_keys = generate_foreign_keys(100, 2.5)
+
+        self.assertEqual([], foreign_keys[0])
+        for index, references in enumerate(foreign_keys):
+            self.assertLessEqual(len(references), 3)
+            self.assertTrue(all(reference < index for reference in references))
+
+    def test_metadata(self) -> None:
+        metadata = generate_metadata(10, 1.0)
+
+        self.assertEqual(10, len(metadata.sorted_tables))
+        self.assertEqual(
+            9, sum(len(table.foreign_keys) for table in metadata.sorted_tables)
+        )
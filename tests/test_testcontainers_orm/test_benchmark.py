@@ -0,0 +1,61 @@
+import json
+import os
+import tempfile
+import unittest
+
+from testcontainers_orm.benchmark import main
+from testcontainers_orm.redis import _RedisTestCase
+
+
+class StrategyArgumentsTest(unittest.TestCase):
+    def test_unsupported_strategy(self) -> None:
+        with self.assertRaises(SystemExit):
+            main(['--backend', 'tortoise', '--tortoise-strategy', 'rollback'])
+
+
+# NOTE: Redis container of this test case stands in for the one benchmark would start
+class RedisBenchmarkTest(_RedisTestCase):
+    def test_stand_in(self) -> None:
+        config = self.get_config()
+        with tempfile.TemporaryDirectory() as path:
+            output = os.path.join(path, 'results.json')
+            main(
+                [
+                    '--backend',
+                    'redis',
+                    '--redis-strategy',
+                    'flushdb',
+                    '--keys',
+                    '10',
+                    '--iterations',
+                    '2',
+                    '--redis',
+                    f'{config.host}:{config.port}',
+                    '--output',
+                    output,
+                ]
+            )
+            with open(output) as file:
+                results = json.load(file)
+
+        self.assertEqual(1, len(results))
+        result = results[0]
+        self.assertEqual(
+            ('redis', 'flushdb', 10, 2),
+            (
+                result['backend'],
+                result['strategy'],
+                result['size'],
+                result['iterations'],
+            ),
+        )
+        self.assertEqual(
+            {'class_setup', 'seed_snapshot', 'setup', 'teardown'},
+            set(result['timings']),
+        )
+        self.assertEqual(
+            [2, 2], [len(result['timings'][phase]) for phase in ('setup', 'teardown')]
+        )
+        self.assertEqual(
+            {'min', 'median', 'mean', 'max'}, set(result['summary']['setup'])
+        )
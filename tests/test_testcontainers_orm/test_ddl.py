@@ -0,0 +1,50 @@
+import unittest
+from typing import Dict
+from typing import List
+
+from testcontainers_orm._bench_schema import generate_foreign_keys
+from testcontainers_orm.ddl import run_in_levels
+from testcontainers_orm.ddl import topological_levels
+
+
+class TopologicalLevelsTest(unittest.TestCase):
+    def test_references_are_in_previous_levels(self) -> None:
+        foreign_keys = generate_foreign_keys(200, 1.5)
+
+        levels = topological_levels(
+            list(range(200)), str, lambda index: map(str, foreign_keys[index])
+        )
+
+        level_of = {
+            index: number for number, level in enumerate(levels) for index in level
+        }
+        self.assertEqual(200, len(level_of))
+        for index, references in enumerate(foreign_keys):
+            self.assertTrue(
+                all(level_of[reference] < level_of[index] for reference in references)
+            )
+            if references:
+                self.assertEqual(
+                    level_of[index],
+                    max(level_of[reference] for reference in references) + 1,
+                )
+
+    def test_self_reference(self) -> None:
+        self.assertEqual(
+            [['a'], ['b']],
+            topological_levels(['b', 'a'], str, lambda name: ['a', name]),
+        )
+
+    def test_cycle(self) -> None:
+        references: Dict[str, List[str]] = {'a': ['b'], 'b': ['a'], 'c': []}
+
+        with self.assertRaises(ValueError):
+            topological_levels(list(references), str, references.__getitem__)
+
+    def test_run_in_levels(self) -> None:
+        created: List[str] = []
+
+        run_in_levels([['a', 'b'], ['c']], created.append, 2)
+
+        self.assertEqual({'a', 'b'}, set(created[:2]))
+        self.assertEqual('c', created[2])
@@ -0,0 +1,35 @@
+import unittest
+
+from testcontainers_orm.digests import StatementDigest
+from testcontainers_orm.digests import StatementDigestLog
+
+
+class FullTableScansTest(unittest.TestCase):
+    def test_only_dml_statements(self) -> None:
+        digests = StatementDigestLog(
+            [
+                StatementDigest(
+                    'test', '1', 'SHOW VARIABLES LIKE ?', 1, no_index_used=1
+                ),
+                StatementDigest(
+                    'test', '2', 'SELECT @@`tx_isolation`', 1, select_scan=1
+                ),
+                StatementDigest(
+                    'test',
+                    '3',
+                    'SELECT * FROM `performance_schema` . `events_statements_summary_by_digest`',
+                    1,
+                    no_index_used=1,
+                ),
+                StatementDigest(
+                    'test',
+                    '4',
+                    'SELECT * FROM `items` WHERE `name` = ?',
+                    1,
+                    no_index_used=1,
+                ),
+                StatementDigest('test', '5', 'SELECT * FROM `items` WHERE `id` = ?', 1),
+            ]
+        )
+
+        self.assertEqual(['4'], [digest.digest for digest in digests.full_table_scans])
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from typing import Type
+
+from sqlalchemy import Column  # type: ignore
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy.ext.declarative import declarative_base  # type: ignore
+
+from testcontainers_orm.fingerprint import files_fingerprint
+from testcontainers_orm.sqlalchemy import _SQLAlchemyTestCase
+from testcontainers_orm.utils import classproperty
+
+ShortNameBase = declarative_base()
+SameShortNameBase = declarative_base()
+LongNameBase = declarative_base()
+
+
+class ShortNameUser(ShortNameBase):
+    __tablename__ = 'user'
+    id = Column(Integer, primary_key=True)
+    name = Column(String(10))
+
+
+class SameShortNameUser(SameShortNameBase):
+    __tablename__ = 'user'
+    id = Column(Integer, primary_key=True)
+    name = Column(String(10))
+
+
+class LongNameUser(LongNameBase):
+    __tablename__ = 'user'
+    id = Column(Integer, primary_key=True)
+    name = Column(String(20))
+
+
+# NOTE: Test cases below are configurations only, `__test__` prevents runners from starting containers for them
+class _ShortNameTestCase(_SQLAlchemyTestCase):
+    __test__ = False
+
+    @classproperty
+    def DECLARATIVE_BASE(self) -> Type:
+        return ShortNameBase
+
+
+class _SameShortNameTestCase(_SQLAlchemyTestCase):
+    __test__ = False
+
+    @classproperty
+    def DECLARATIVE_BASE(self) -> Type:
+        return SameShortNameBase
+
+
+class _LongNameTestCase(_SQLAlchemyTestCase):
+    __test__ = False
+
+    @classproperty
+    def DECLARATIVE_BASE(self) -> Type:
+        return LongNameBase
+
+
+class SchemaFingerprintTest(unittest.TestCase):
+    def test_same_schema(self) -> None:
+        self.assertEqual(
+            _ShortNameTestCase.get_schema_fingerprint(),
+            _SameShortNameTestCase.get_schema_fingerprint(),
+        )
+
+    def test_different_schema(self) -> None:
+        self.assertNotEqual(
+            _ShortNameTestCase.get_schema_fingerprint(),
+            _LongNameTestCase.get_schema_fingerprint(),
+        )
+
+
+class FilesFingerprintTest(unittest.TestCase):
+    def test_file_changed(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            filename = os.path.join(path, 'revision.py')
+            with open(filename, 'w') as file:
+                file.write('a')
+            fingerprint = files_fingerprint([path])
+            self.assertEqual(fingerprint, files_fingerprint([path]))
+
+            with open(filename, 'w') as file:
+                file.write('b')
+            self.assertNotEqual(fingerprint, files_fingerprint([path]))
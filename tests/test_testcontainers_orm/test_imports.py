@@ -0,0 +1,81 @@
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import unittest
+from typing import List
+
+# NOTE: Heavy dependencies which must be imported only when feature requiring them is used
+FORBIDDEN_MODULES = {
+    'testcontainers_orm.database': {
+        'testcontainers',
+        'docker',
+        'sqlalchemy',
+        'pymysql',
+    },
+    'testcontainers_orm.sqlalchemy': {
+        'testcontainers',
+        'docker',
+        'alembic',
+        'typing_inspect',
+        'sqlalchemy_repr',
+    },
+    'testcontainers_orm.tortoise': {
+        'testcontainers',
+        'docker',
+        'alembic',
+        'sqlalchemy',
+    },
+    'testcontainers_orm.redis': {'testcontainers', 'docker'},
+    'testcontainers_orm.pytest_plugin': {
+        'testcontainers',
+        'docker',
+        'sqlalchemy',
+        'redis',
+        'pymysql',
+    },
+    'testcontainers_orm.pytest_scheduling': {
+        'testcontainers',
+        'docker',
+        'sqlalchemy',
+        'redis',
+        'pymysql',
+    },
+}
+
+# NOTE: pytest plugins can't be imported without pytest, which is a development dependency only
+PYTEST_MODULES = {
+    'testcontainers_orm.pytest_plugin',
+    'testcontainers_orm.pytest_scheduling',
+}
+
+SCRIPT = '''
+import json, sys
+import {module}
+print(json.dumps(sorted(sys.modules)))
+'''
+
+
+def import_module(module: str) -> List[str]:
+    """Names of modules imported along with a given one in a fresh interpreter."""
+    output = subprocess.check_output(
+        [sys.executable, '-c', SCRIPT.format(module=module)],
+        env={**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)},
+    )
+    return json.loads(output)
+
+
+class ImportsTest(unittest.TestCase):
+    def test_heavy_dependencies_are_not_imported(self) -> None:
+        for module, forbidden_modules in FORBIDDEN_MODULES.items():
+            with self.subTest(module=module):
+                if (
+                    module in PYTEST_MODULES
+                    and importlib.util.find_spec('pytest') is None
+                ):
+                    self.skipTest('pytest is not installed')
+                imported_modules = {
+                    name.split('.')[0] for name in import_module(module)
+                }
+                self.assertSetEqual(set(), forbidden_modules & imported_modules)
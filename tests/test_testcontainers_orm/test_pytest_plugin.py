@@ -0,0 +1,54 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+TEST_MODULE = '''
+import sys
+
+
+def test_pure():
+    assert not {'testcontainers', 'docker', 'sqlalchemy', 'redis'} & {name.split('.')[0] for name in sys.modules}
+
+
+def test_mysql(testcontainers_sqlalchemy_session):
+    pass
+
+
+def test_redis(testcontainers_redis_client):
+    pass
+'''
+
+
+# NOTE: Tests are run with nosetests, pytest is needed only to load the plugin
+@unittest.skipIf(importlib.util.find_spec('pytest') is None, 'pytest is not installed')
+class PytestPluginTest(unittest.TestCase):
+    def test_containers_are_not_started_for_pure_tests(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            with open(os.path.join(path, 'test_module.py'), 'w') as file:
+                file.write(TEST_MODULE)
+
+            process = subprocess.run(
+                [
+                    sys.executable,
+                    '-m',
+                    'pytest',
+                    '-p',
+                    'testcontainers_orm.pytest_plugin',
+                    '-k',
+                    'pure',
+                    path,
+                ],
+                env={
+                    **os.environ,
+                    'PYTHONPATH': os.pathsep.join(sys.path),
+                    'PYTEST_DISABLE_PLUGIN_AUTOLOAD': '1',
+                },
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+
+        self.assertEqual(0, process.returncode, process.stdout.decode())
+        self.assertIn('1 passed, 2 deselected', process.stdout.decode())
@@ -0,0 +1,83 @@
+import unittest
+
+from redis import Redis
+
+from testcontainers_orm.commands import max_commands
+from testcontainers_orm.redis import _RedisTestCase
+
+
+class SeedRedisTest(_RedisTestCase):
+    @classmethod
+    def seed(cls, client: Redis) -> None:
+        with client.pipeline(transaction=False) as pipeline:
+            for i in range(2500):
+                pipeline.set(f'item:{i}', i)
+            pipeline.hset('hash', 'key', 'value')
+            pipeline.set('expiring', 1, ex=3600)
+            pipeline.execute()
+
+    def test_seeded(self) -> None:
+        client = self.get_client()
+
+        self.assertEqual(2502, client.dbsize())
+        self.assertEqual(b'42', client.get('item:42'))
+        self.assertEqual(b'value', client.hget('hash', 'key'))
+        self.assertGreater(client.ttl('expiring'), 0)
+
+    def test_delete(self) -> None:
+        self.get_client().flushdb()
+
+    def test_seeded_again(self) -> None:
+        self.assertEqual(2502, self.get_client().dbsize())
+
+
+class CommandsRedisTest(_RedisTestCase):
+    def test_pipeline(self) -> None:
+        client = self.get_client()
+        client.ping()
+
+        with self.assertMaxRoundTrips(1) as commands:
+            with client.pipeline(transaction=False) as pipeline:
+                for i in range(100):
+                    pipeline.get(f'item:{i}')
+                pipeline.execute()
+
+        self.assertEqual(100, commands.count)
+        self.assertEqual([100], commands.pipeline_sizes)
+
+    def test_round_trips_exceeded(self) -> None:
+        client = self.get_client()
+        client.ping()
+
+        with self.assertRaises(AssertionError):
+            with self.assertMaxRoundTrips(1):
+                for i in range(100):
+                    client.get(f'item:{i}')
+
+    @max_commands(1)
+    def test_max_commands_decorator(self) -> None:
+        self.get_client().set('key', 'value')
+
+
+class CommandStatsRedisTest(unittest.TestCase):
+    def test_test_method_only(self) -> None:
+        class SetRedisTest(SeedRedisTest):
+            def test_set(self) -> None:
+                self.get_client().set('key', 'value')
+
+        SetRedisTest.setUpClass()
+        self.addCleanup(SetRedisTest.tearDownClass)
+        test = SetRedisTest('test_set')
+        test.run()
+
+        assert test.command_stats is not None
+        self.assertEqual(1, test.command_stats.commands)
+
+
+class IsolationRedisTest(unittest.TestCase):
+    def test_unknown_isolation(self) -> None:
+        class UnknownIsolationRedisTest(_RedisTestCase):
+            ISOLATION = 'truncate'
+
+        with self.assertRaises(ValueError):
+            UnknownIsolationRedisTest.setUpClass()
@@ -0,0 +1,63 @@
+import unittest
+from typing import List
+from typing import Type
+
+from sqlalchemy.ext.declarative import declarative_base  # type: ignore
+
+from testcontainers_orm._bench_schema import generate_foreign_keys
+from testcontainers_orm._bench_schema import generate_metadata
+from testcontainers_orm.sqlalchemy import RequiredTable
+from testcontainers_orm.sqlalchemy import _SQLAlchemyTestCase
+from testcontainers_orm.sqlalchemy import required_tables
+from testcontainers_orm.utils import classproperty
+
+Base = declarative_base(metadata=generate_metadata(50, 1.0))
+
+
+# NOTE: Test cases below are configurations only, `__test__` prevents runners from starting containers for them
+class _AllTablesTestCase(_SQLAlchemyTestCase):
+    __test__ = False
+
+    @classproperty
+    def DECLARATIVE_BASE(self) -> Type:
+        return Base
+
+
+class _RequiredTablesTestCase(_SQLAlchemyTestCase):
+    __test__ = False
+
+    @classproperty
+    def DECLARATIVE_BASE(self) -> Type:
+        return Base
+
+    @classproperty
+    def REQUIRED_TABLES(self) -> List[RequiredTable]:
+        return ['benchmark_0049']
+
+    @required_tables('benchmark_0000')
+    def test_method(self) -> None:
+        pass
+
+
+class RequiredTablesTest(unittest.TestCase):
+    def test_all_tables(self) -> None:
+        self.assertEqual(50, len(_AllTablesTestCase.get_tables()))
+        self.assertEqual(50, len(_RequiredTablesTestCase.get_tables([])))
+
+    def test_foreign_key_closure(self) -> None:
+        foreign_keys = generate_foreign_keys(50, 1.0)
+        expected, pending = set(), [49]
+        while pending:
+            index = pending.pop()
+            expected.add(f'benchmark_{index:04d}')
+            pending.extend(foreign_keys[index])
+
+        tables = _RequiredTablesTestCase.get_tables()
+
+        self.assertSetEqual(expected, {table.name for table in tables})
+        self.assertEqual('benchmark_0049', tables[-1].name)
+
+    def test_decorator(self) -> None:
+        tables = _RequiredTablesTestCase('test_method')._get_test_tables()
+
+        self.assertEqual(['benchmark_0000'], [table.name for table in tables])
@@ -0,0 +1,197 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from testcontainers_orm.scheduling import CostModel
+from testcontainers_orm.scheduling import ScheduledTestLoader
+from testcontainers_orm.scheduling import balance_groups
+from testcontainers_orm.scheduling import group_tests
+from testcontainers_orm.scheduling import schedule_suite
+
+
+# NOTE: `__test__` prevents these test cases from being collected by runners
+class MySQL57Test(unittest.TestCase):
+    __test__ = False
+    IMAGE = 'mysql:5.7'
+    ISOLATION = 'drop_create'
+
+    def test_first(self) -> None:
+        pass
+
+    def test_second(self) -> None:
+        pass
+
+
+class MySQL80Test(MySQL57Test):
+    IMAGE = 'mysql:8.0'
+
+
+class MySQL80TruncateTest(MySQL80Test):
+    ISOLATION = 'truncate'
+
+
+class Another57Test(MySQL57Test):
+    pass
+
+
+class SchedulingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        loader = unittest.TestLoader()
+        self.tests = [
+            test_class(name)
+            for test_class in (
+                MySQL57Test,
+                MySQL80Test,
+                Another57Test,
+                MySQL80TruncateTest,
+            )
+            for name in loader.getTestCaseNames(test_class)
+        ]
+
+    def test_group_tests(self) -> None:
+        groups = group_tests(
+            [
+                test
+                for test in schedule_suite(unittest.TestSuite(self.tests), CostModel())
+                if test.countTestCases()
+            ],
+            type,
+            lambda test: test.id(),
+            CostModel(),
+        )
+
+        self.assertEqual(
+            [
+                ('mysql:5.7', '', 'drop_create'),
+                ('mysql:8.0', '', 'drop_create'),
+                ('mysql:8.0', '', 'truncate'),
+            ],
+            [group.key for group in groups],
+        )
+        self.assertEqual(
+            [MySQL57Test] * 2 + [Another57Test] * 2,
+            [type(test) for test in groups[0].tests],
+        )
+        self.assertEqual(4 * 1.0 + 10.0, groups[0].cost)
+
+    def test_cost_model(self) -> None:
+        timings = {test.id(): 1.0 for test in self.tests}
+        timings[MySQL80TruncateTest('test_first').id()] = 100.0
+
+        groups = group_tests(
+            self.tests,
+            type,
+            lambda test: test.id(),
+            CostModel(timings, setup_cost=10.0),
+        )
+
+        self.assertEqual([14.0, 12.0, 111.0], [group.cost for group in groups])
+
+    def test_balance_groups(self) -> None:
+        timings = {test.id(): 1.0 for test in self.tests}
+        timings[MySQL80TruncateTest('test_first').id()] = 100.0
+        groups = group_tests(
+            self.tests,
+            type,
+            lambda test: test.id(),
+            CostModel(timings, setup_cost=10.0),
+        )
+
+        assignments = balance_groups(groups, 2)
+
+        self.assertEqual(
+            [
+                [('mysql:8.0', '', 'truncate')],
+                [('mysql:5.7', '', 'drop_create'), ('mysql:8.0', '', 'drop_create')],
+            ],
+            [[group.key for group in worker_groups] for worker_groups in assignments],
+        )
+
+    def test_stop_image_containers(self) -> None:
+        suite = schedule_suite(unittest.TestSuite(self.tests), CostModel())
+        result = unittest.TestResult()
+        stopped = []
+
+        with patch(
+            'testcontainers_orm.scheduling.stop_image_container',
+            lambda image: stopped.append((image, result.testsRun)),
+        ):
+            suite.run(result)
+
+        self.assertEqual(8, suite.countTestCases())
+        self.assertEqual([('mysql:5.7', 4), ('mysql:8.0', 8)], stopped)
+
+    def test_loader(self) -> None:
+        loader = ScheduledTestLoader(CostModel(), worker=1, workers=2)
+
+        suite = loader.loadTestsFromNames(
+            [f'{__name__}.MySQL57Test', f'{__name__}.MySQL80Test']
+        )
+
+        self.assertEqual(2, suite.countTestCases())
+
+
+PYTEST_MODULE = '''
+import unittest
+
+
+class MySQL80Test(unittest.TestCase):
+    IMAGE = 'mysql:8.0'
+
+    def test_first(self):
+        pass
+
+
+class MySQL57Test(unittest.TestCase):
+    IMAGE = 'mysql:5.7'
+
+    def test_first(self):
+        pass
+
+
+class Another80Test(MySQL80Test):
+    pass
+'''
+
+
+@unittest.skipIf(importlib.util.find_spec('pytest') is None, 'pytest is not installed')
+class PytestSchedulingTest(unittest.TestCase):
+    def test_collection_order(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            with open(os.path.join(path, 'test_module.py'), 'w') as file:
+                file.write(PYTEST_MODULE)
+
+            process = subprocess.run(
+                [
+                    sys.executable,
+                    '-m',
+                    'pytest',
+                    '-p',
+                    'testcontainers_orm.pytest_scheduling',
+                    '--collect-only',
+                    '-q',
+                    path,
+                ],
+                env={
+                    **os.environ,
+                    'PYTHONPATH': os.pathsep.join(sys.path),
+                    'PYTEST_DISABLE_PLUGIN_AUTOLOAD': '1',
+                },
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+
+        output = process.stdout.decode()
+        self.assertEqual(0, process.returncode, output)
+        self.assertEqual(
+            [
+                'test_module.py::MySQL57Test::test_first',
+                'test_module.py::MySQL80Test::test_first',
+                'test_module.py::Another80Test::test_first',
+            ],
+            [line.split('/')[-1] for line in output.splitlines() if '::' in line],
+        )
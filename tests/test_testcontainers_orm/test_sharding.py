@@ -0,0 +1,177 @@
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+from typing import Dict
+from typing import List
+from unittest.mock import patch
+
+from docker.errors import NotFound  # type: ignore
+
+from testcontainers_orm.sharding import RUN_ID_ENV
+from testcontainers_orm.sharding import SHARDS_ENV
+from testcontainers_orm.sharding import WORKER_ID_ENV
+from testcontainers_orm.sharding import HashRing
+from testcontainers_orm.sharding import get_container_name
+from testcontainers_orm.sharding import get_shard
+from testcontainers_orm.sharding import get_shard_count
+from testcontainers_orm.sharding import get_worker_database
+from testcontainers_orm.sharding import start_shared_container
+
+WORKERS = [f'gw{index}' for index in range(64)]
+
+
+class HashRingTest(unittest.TestCase):
+    def test_all_shards_used(self) -> None:
+        self.assertSetEqual({0, 1, 2, 3}, {get_shard(worker, 4) for worker in WORKERS})
+
+    def test_stable(self) -> None:
+        self.assertEqual(
+            [get_shard(worker, 4) for worker in WORKERS],
+            [get_shard(worker, 4) for worker in WORKERS],
+        )
+
+    def test_adding_shard_moves_workers_to_it_only(self) -> None:
+        for worker in WORKERS:
+            before, after = get_shard(worker, 4), get_shard(worker, 5)
+            self.assertIn(after, (before, 4))
+
+    def test_empty(self) -> None:
+        with self.assertRaises(ValueError):
+            HashRing([])
+
+
+class ShardingConfigTest(unittest.TestCase):
+    def test_not_sharded_by_default(self) -> None:
+        with patch.dict(os.environ, {SHARDS_ENV: '1', RUN_ID_ENV: 'run'}):
+            self.assertEqual('test', get_worker_database('test'))
+
+    def test_worker_database(self) -> None:
+        with patch.dict(
+            os.environ, {SHARDS_ENV: '2', RUN_ID_ENV: 'run', WORKER_ID_ENV: 'gw-1'}
+        ):
+            self.assertEqual('test_gw_1', get_worker_database('test'))
+
+    def test_auto(self) -> None:
+        with patch.dict(os.environ, {SHARDS_ENV: 'auto'}):
+            self.assertGreaterEqual(get_shard_count(), 1)
+
+    def test_container_name(self) -> None:
+        self.assertEqual(
+            'testcontainers-orm-mysql_mysql_server_8_0-abc-1',
+            get_container_name('mysql/mysql-server:8.0', 'abc', 1),
+        )
+
+
+class FakeDockerContainer:
+    def __init__(self, containers: 'FakeContainers', name: str) -> None:
+        self.containers = containers
+        self.name = name
+        self.id = name
+
+    def remove(self, force: bool, v: bool) -> None:
+        self.containers.removed.append(self.name)
+        del self.containers.running[self.name]
+
+
+class FakeContainers:
+    """Containers of a Docker host shared by all workers."""
+
+    def __init__(self) -> None:
+        self.running: Dict[str, FakeDockerContainer] = {}
+        self.removed: List[str] = []
+
+    def get(self, name: str) -> FakeDockerContainer:
+        if name not in self.running:
+            raise NotFound(name)
+        return self.running[name]
+
+
+class FakeContainer:
+    """Testcontainers object of a worker."""
+
+    image = 'mysql:8.0'
+    port_to_expose = 3306
+
+    def __init__(self, containers: FakeContainers) -> None:
+        self.containers = containers
+        self.name = ''
+        self.client = self
+        self.started = False
+
+    def get_docker_client(self) -> 'FakeContainer':
+        return self
+
+    def with_name(self, name: str) -> 'FakeContainer':
+        self.name = name
+        return self
+
+    def start(self) -> 'FakeContainer':
+        self.containers.running[self.name] = FakeDockerContainer(
+            self.containers, self.name
+        )
+        self.started = True
+        return self
+
+    def stop(self) -> None:
+        self.get_wrapped_container().remove(force=True, v=True)
+
+    def get_wrapped_container(self) -> FakeDockerContainer:
+        return self.containers.running[self.name]
+
+
+class SharedContainerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.containers = FakeContainers()
+        self.name = f'testcontainers-orm-test-{uuid.uuid4().hex}'
+        self.lock_path = os.path.join(tempfile.gettempdir(), f'{self.name}.lock')
+
+    def test_last_worker_stops_container(self) -> None:
+        first = start_shared_container(FakeContainer(self.containers), self.name)
+        second = start_shared_container(FakeContainer(self.containers), self.name)
+
+        self.assertEqual(1, len(self.containers.running))
+        self.assertIs(first.get_wrapped_container(), second.get_wrapped_container())
+        self.assertEqual('mysql:8.0', second.image)
+        self.assertEqual(3306, second.port_to_expose)
+
+        first.stop()
+        self.assertEqual(1, len(self.containers.running))
+        self.assertTrue(os.path.exists(self.lock_path))
+
+        second.stop()
+        self.assertEqual([self.name], self.containers.removed)
+        self.assertFalse(os.path.exists(self.lock_path))
+
+    def test_stop_twice(self) -> None:
+        shared = start_shared_container(FakeContainer(self.containers), self.name)
+        other = start_shared_container(FakeContainer(self.containers), self.name)
+
+        shared.stop()
+        shared.stop()
+
+        self.assertEqual(1, len(self.containers.running))
+        other.stop()
+        self.assertEqual([self.name], self.containers.removed)
+
+    def test_starting_worker_waits_for_release(self) -> None:
+        container = FakeContainer(self.containers)
+        shared = start_shared_container(container, self.name)
+        other = start_shared_container(FakeContainer(self.containers), self.name)
+        self.assertTrue(container.started)
+
+        # NOTE: Container is used by another worker, so its testcontainers object must outlive the wait
+        shared.stop()
+        shared._wait_for_release(timeout=0.0)
+        self.assertTrue(os.path.exists(self.lock_path))
+        self.assertEqual(1, len(self.containers.running))
+
+        other.stop()
+        shared._wait_for_release(timeout=0.0)
+        self.assertEqual([self.name], self.containers.removed)
+
+    def test_unix_only(self) -> None:
+        with patch.dict(sys.modules, {'fcntl': None}):
+            with self.assertRaisesRegex(RuntimeError, 'Unix'):
+                start_shared_container(FakeContainer(self.containers), self.name)
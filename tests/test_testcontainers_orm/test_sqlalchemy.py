@@ -1,16 +1,27 @@
 import os.path
+import unittest
+from typing import List
 
 from sqlalchemy import TIMESTAMP  # type: ignore
 from sqlalchemy import Column  # type: ignore
+from sqlalchemy import Index  # type: ignore
 from sqlalchemy import Integer  # type: ignore
+from sqlalchemy import MetaData  # type: ignore
 from sqlalchemy import Numeric  # type: ignore
 from sqlalchemy import String  # type: ignore
+from sqlalchemy import Table  # type: ignore
+from sqlalchemy import UniqueConstraint  # type: ignore
 from sqlalchemy import text  # type: ignore
 from typing_extensions import Type
 
+from testcontainers_orm.fixtures import Fixture
+from testcontainers_orm.queries import max_queries
 from testcontainers_orm.sqlalchemy import Base
+from testcontainers_orm.sqlalchemy import ConnectionFactory
 from testcontainers_orm.sqlalchemy import Storage
 from testcontainers_orm.sqlalchemy import _SQLAlchemyAlembicTestCase
+from testcontainers_orm.sqlalchemy import _SQLAlchemyTestCase
+from testcontainers_orm.sqlalchemy import get_table_spec
 from testcontainers_orm.utils import classproperty
 
 
@@ -80,3 +91,167 @@ class Alembic80SQLAlchemyTest(_SQLAlchemyAlembicTestCase):
     @classproperty
     def ALEMBIC_CONFIG_PATH(self) -> str:
         return 'tests/test_testcontainers_orm/alembic.ini'
+
+
+class QueriesSQLAlchemyTest(_SQLAlchemyTestCase):
+    @classproperty
+    def STORAGE_CLASS(self) -> Type[Storage]:
+        return TestStorage
+
+    def test_max_queries(self) -> None:
+        with self.assertMaxQueries(2) as queries:
+            self.storage.add(Item(name='item'))
+            self.storage.flush()
+            self.storage.query(Item).all()
+
+        self.assertEqual(2, queries.count)
+
+    def test_max_queries_exceeded(self) -> None:
+        with self.assertRaises(AssertionError):
+            with self.assertMaxQueries(1):
+                with self.get_session() as session:
+                    for _ in range(3):
+                        session.query(Item).all()
+
+    @max_queries(1)
+    def test_max_queries_decorator(self) -> None:
+        self.storage.query(Item).all()
+
+
+class StatementDigestsSQLAlchemyTest(_SQLAlchemyTestCase):
+    CAPTURE_STATEMENT_DIGESTS = True
+
+    def test_no_full_table_scans(self) -> None:
+        with self.assertNoFullTableScans():
+            self.storage.query(Item).filter(Item.id == 1).all()
+
+    def test_full_table_scan(self) -> None:
+        with self.assertRaises(AssertionError):
+            with self.assertNoFullTableScans():
+                self.storage.query(Item).filter(Item.name == 'item').all()
+
+
+class ConnectionLeaksSQLAlchemyTest(_SQLAlchemyTestCase):
+    CHECK_CONNECTION_LEAKS = True
+
+    def test_pool_stats(self) -> None:
+        connection_factory = ConnectionFactory(self.get_config())
+        with connection_factory.create() as connection:
+            connection.execute('SELECT 1')
+        connection_factory.dispose()
+
+        self.assertEqual(1, connection_factory.pool_stats.checkouts)
+        self.assertEqual(1, connection_factory.pool_stats.checkins)
+        self.assertNoConnectionLeaks()
+
+    def test_invalidated_transaction(self) -> None:
+        connection_factory = ConnectionFactory(self.get_config())
+        with connection_factory.create() as connection:
+            transaction = connection.begin()
+            connection.invalidate()
+            transaction.rollback()
+        connection_factory.dispose()
+
+        self.assertNoConnectionLeaks()
+
+    def test_connection_leak(self) -> None:
+        connection = ConnectionFactory(self.get_config())._get_engine().connect()
+        connection.begin()
+
+        with self.assertRaises(AssertionError):
+            self.assertNoConnectionLeaks()
+        assert self._pool_monitor is not None
+        self.assertEqual(1, self._pool_monitor.stats.open_transactions)
+
+
+class TruncateIsolationSQLAlchemyTest(_SQLAlchemyTestCase):
+    ISOLATION = 'truncate'
+
+    def test_insert(self) -> None:
+        self.storage.add(Item(id=1, name='item'))
+        self.storage.commit()
+
+    def test_insert_again(self) -> None:
+        self.storage.add(Item(id=1, name='item'))
+        self.storage.commit()
+
+
+class RollbackIsolationSQLAlchemyTest(_SQLAlchemyTestCase):
+    ISOLATION = 'rollback'
+
+    def test_insert(self) -> None:
+        self.storage.add(Item(id=1, name='item'))
+        self.storage.commit()
+
+        with self.get_session() as session:
+            self.assertEqual(1, session.query(Item).count())
+
+    def test_insert_again(self) -> None:
+        self.storage.add(Item(id=1, name='item'))
+        self.storage.commit()
+
+
+class FixturesSQLAlchemyTest(_SQLAlchemyTestCase):
+    ISOLATION = 'truncate'
+
+    @classproperty
+    def FIXTURES(self) -> List[Fixture]:
+        return [
+            Fixture(
+                'items',
+                lambda: ({'id': id_, 'name': f'item_{id_}'} for id_ in range(1, 2001)),
+            )
+        ]
+
+    def test_delete(self) -> None:
+        self.storage.query(Item).delete()
+        self.storage.commit()
+
+        self.assertEqual(0, self.storage.query(Item).count())
+
+    def test_seeded(self) -> None:
+        self.assertEqual(2000, self.storage.query(Item).count())
+
+
+class ParallelDDLSQLAlchemyTest(_SQLAlchemyTestCase):
+    DDL_WORKERS = 4
+
+    def test_insert(self) -> None:
+        self.storage.add(Item(id=1, name='item'))
+        self.storage.commit()
+
+        self.assertEqual(1, self.storage.query(Item).count())
+
+
+class SyntheticDataSQLAlchemyTest(_SQLAlchemyTestCase):
+    ISOLATION = 'truncate'
+
+    def test_generate_data(self) -> None:
+        self.generate_data({Item: 2500}, chunk_size=1000)
+
+        self.assertEqual(2500, self.storage.query(Item).count())
+        self.assertEqual(
+            2500, self.storage.query(Item).filter(Item.name.isnot(None)).count()
+        )
+
+
+class GetTableSpecTest(unittest.TestCase):
+    def test_unique_constraints_and_indexes(self) -> None:
+        table = Table(
+            'codes',
+            MetaData(),
+            Column('id', Integer, primary_key=True),
+            Column('login', String(8)),
+            Column('group', Integer),
+            Column('code', String(8)),
+            Column('serial', Integer),
+            UniqueConstraint('group', 'code'),
+            Index('ix_serial', 'serial', unique=True),
+        )
+
+        spec = get_table_spec(table, 10)
+
+        self.assertEqual(
+            {'id': True, 'login': False, 'group': True, 'code': False, 'serial': True},
+            {column.name: column.unique for column in spec.columns},
+        )
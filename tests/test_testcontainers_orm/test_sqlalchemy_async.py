@@ -0,0 +1,46 @@
+import asyncio
+import unittest
+
+from sqlalchemy import func  # type: ignore
+from sqlalchemy import select  # type: ignore
+
+from tests.test_testcontainers_orm import test_sqlalchemy
+
+# NOTE: Asyncio extension is available since SQLAlchemy 1.4, package itself supports 1.3
+try:
+    from testcontainers_orm.sqlalchemy_async import AsyncSessionFactory
+    from testcontainers_orm.sqlalchemy_async import AsyncStorage
+    from testcontainers_orm.sqlalchemy_async import _AsyncSQLAlchemyTestCase
+except ImportError as exc:
+    raise unittest.SkipTest(str(exc)) from exc
+
+# NOTE: Model is shared with sync tests, module is imported to avoid collecting its test cases twice
+Item = test_sqlalchemy.Item
+
+
+class RollbackIsolationAsyncSQLAlchemyTest(_AsyncSQLAlchemyTestCase):
+    async def test_insert(self) -> None:
+        self.storage.add(Item(id=1, name='item'))
+        await self.storage.commit()
+
+        async with self.get_async_session() as session:
+            self.assertEqual(1, await session.scalar(select(func.count(Item.id))))
+
+    async def test_insert_again(self) -> None:
+        self.storage.add(Item(id=1, name='item'))
+        await self.storage.commit()
+
+
+class TruncateIsolationAsyncSQLAlchemyTest(_AsyncSQLAlchemyTestCase):
+    ISOLATION = 'truncate'
+
+    async def test_concurrent_sessions(self) -> None:
+        session_factory = AsyncSessionFactory[AsyncStorage](self.get_config())
+
+        async def insert(id_: int) -> None:
+            async with session_factory.create() as session:
+                session.add(Item(id=id_, name=f'item_{id_}'))
+
+        await asyncio.gather(*(insert(id_) for id_ in range(1, 11)))
+
+        self.assertEqual(10, await self.storage.scalar(select(func.count(Item.id))))
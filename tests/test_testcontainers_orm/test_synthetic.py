@@ -0,0 +1,123 @@
+import sys
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+from testcontainers_orm.synthetic import ColumnSpec
+from testcontainers_orm.synthetic import TableSpec
+from testcontainers_orm.synthetic import generate_chunks
+from testcontainers_orm.synthetic import mark_unique_together
+
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None
+
+
+def create_tables() -> list:
+    return [
+        TableSpec(
+            'users',
+            5,
+            [
+                ColumnSpec('id', int, primary_key=True, unique=True),
+                ColumnSpec('login', str, unique=True, length=8),
+                ColumnSpec('status', str, choices=['active', 'blocked']),
+                ColumnSpec('balance', Decimal, precision=6, scale=2),
+            ],
+        ),
+        TableSpec(
+            'orders',
+            12,
+            [
+                ColumnSpec('id', int, primary_key=True, unique=True),
+                ColumnSpec('user_id', int, references='users'),
+                ColumnSpec('comment', str, nullable=True),
+                ColumnSpec('created_at', datetime),
+            ],
+        ),
+    ]
+
+
+class GenerateChunksTest(unittest.TestCase):
+    def test_chunks(self) -> None:
+        chunks = list(generate_chunks(create_tables(), chunk_size=5))
+
+        self.assertEqual([5, 5, 5, 2], [len(rows) for _, rows in chunks])
+        self.assertEqual(
+            'INSERT INTO `users` (`id`, `login`, `status`, `balance`) VALUES (%s, %s, %s, %s)',
+            chunks[0][0],
+        )
+        orders = [
+            row for statement, rows in chunks if '`orders`' in statement for row in rows
+        ]
+        self.assertEqual(list(range(1, 13)), [row[0] for row in orders])
+
+    def test_values(self) -> None:
+        chunks = list(generate_chunks(create_tables(), chunk_size=5))
+        users, orders = chunks[0][1], [row for _, rows in chunks[1:] for row in rows]
+
+        self.assertEqual(5, len({row[1] for row in users}))
+        self.assertTrue(all(row[2] in ('active', 'blocked') for row in users))
+        self.assertTrue(all(row[3] < 10000 for row in users))
+        self.assertTrue(all(1 <= row[1] <= 5 for row in orders))
+        self.assertTrue(all(isinstance(row[3], datetime) for row in orders))
+
+    def test_seed(self) -> None:
+        self.assertEqual(
+            list(generate_chunks(create_tables(), seed=1)),
+            list(generate_chunks(create_tables(), seed=1)),
+        )
+        self.assertNotEqual(
+            list(generate_chunks(create_tables(), seed=1)),
+            list(generate_chunks(create_tables(), seed=2)),
+        )
+
+    def test_missing_reference(self) -> None:
+        with self.assertRaises(ValueError):
+            list(generate_chunks(create_tables()[1:]))
+
+    def test_unique_string_length(self) -> None:
+        tables = [
+            TableSpec('codes', 1296, [ColumnSpec('code', str, unique=True, length=2)])
+        ]
+
+        codes = [row[0] for _, rows in generate_chunks(tables) for row in rows]
+        self.assertEqual(1296, len(set(codes)))
+        self.assertTrue(all(len(code) <= 2 for code in codes))
+
+        tables[0].rows += 1
+        with self.assertRaises(ValueError):
+            list(generate_chunks(tables))
+
+    def test_unique_together(self) -> None:
+        columns = [
+            ColumnSpec('user_id', int, references='users'),
+            ColumnSpec('status', str, choices=['active', 'blocked']),
+            ColumnSpec('code', str, length=8),
+        ]
+        mark_unique_together(columns, ['user_id', 'status', 'code'])
+
+        self.assertEqual([False, False, True], [column.unique for column in columns])
+
+    def test_without_numpy(self) -> None:
+        with patch.dict(sys.modules, {'numpy': None}):
+            self.assertEqual(
+                list(generate_chunks(create_tables(), use_numpy=False)),
+                list(generate_chunks(create_tables())),
+            )
+            with self.assertRaises(ImportError):
+                list(generate_chunks(create_tables(), use_numpy=True))
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_numpy(self) -> None:
+        chunks = list(generate_chunks(create_tables(), chunk_size=5, use_numpy=True))
+        orders = [row for _, rows in chunks[1:] for row in rows]
+
+        self.assertEqual([5, 5, 5, 2], [len(rows) for _, rows in chunks])
+        self.assertTrue(all(1 <= row[1] <= 5 for row in orders))
+        self.assertEqual(
+            chunks, list(generate_chunks(create_tables(), chunk_size=5, use_numpy=True))
+        )
+        self.assertEqual(chunks, list(generate_chunks(create_tables(), chunk_size=5)))
@@ -1,10 +1,17 @@
 import os.path
+from typing import Any
+from typing import List
 
 from tortoise import Model
+from tortoise import Tortoise
 from tortoise import fields  # type: ignore
+from tortoise.transactions import in_transaction  # type: ignore
 
+from testcontainers_orm.fixtures import Fixture
+from testcontainers_orm.queries import max_queries
 from testcontainers_orm.tortoise import TimestampField
 from testcontainers_orm.tortoise import _AlembicTortoiseTestCase
+from testcontainers_orm.tortoise import _TortoiseTestCase
 from testcontainers_orm.utils import classproperty
 
 
@@ -35,3 +42,127 @@ class AlembicTortoiseTestCase(_AlembicTortoiseTestCase):
     @classproperty
     def ALEMBIC_CONFIG_PATH(self) -> str:
         return 'tests/test_testcontainers_orm/alembic.ini'
+
+
+class ItemTortoiseTestCase(_TortoiseTestCase):
+    @classproperty
+    def MODELS_MODULE(self) -> str:
+        return 'tests.test_testcontainers_orm.test_tortoise'
+
+
+class ConnectionLeaksTortoiseTest(ItemTortoiseTestCase):
+    CHECK_CONNECTION_LEAKS = True
+
+    async def test_pool_stats(self) -> None:
+        # NOTE: Connections acquired to create schema are counted too
+        assert self._tortoise_pool_monitor is not None
+        stats = self._tortoise_pool_monitor.stats
+        checkouts, checkins = stats.checkouts, stats.checkins
+        async with in_transaction() as conn:
+            await conn.execute_query('SELECT 1')
+
+        self.assertEqual(checkouts + 1, stats.checkouts)
+        self.assertEqual(checkins + 1, stats.checkins)
+        self.assertNoConnectionLeaks()
+
+    async def test_connection_leak(self) -> None:
+        client: Any = Tortoise.get_connection('default')
+        connection = await client._pool.acquire()
+        await connection.begin()
+
+        with self.assertRaises(AssertionError):
+            self.assertNoConnectionLeaks()
+        assert self._tortoise_pool_monitor is not None
+        self.assertEqual(1, self._tortoise_pool_monitor.stats.open_transactions)
+
+
+class QueriesTortoiseTest(ItemTortoiseTestCase):
+    async def test_max_queries(self) -> None:
+        with self.assertMaxQueries(2) as queries:
+            await Item.create(name='item')
+            await Item.all()
+
+        self.assertEqual(2, queries.count)
+
+    async def test_max_queries_exceeded(self) -> None:
+        with self.assertRaises(AssertionError):
+            with self.assertMaxQueries(1):
+                async with in_transaction():
+                    for _ in range(3):
+                        await Item.all()
+
+    @max_queries(1)
+    async def test_max_queries_decorator(self) -> None:
+        await Item.all()
+
+    async def test_query_time_under(self) -> None:
+        with self.assertQueryTimeUnder(10000) as queries:
+            await Item.all()
+
+        self.assertEqual(1, queries.count)
+
+    async def test_query_time_exceeded(self) -> None:
+        with self.assertRaises(AssertionError):
+            with self.assertQueryTimeUnder(1):
+                await Tortoise.get_connection('default').execute_query(
+                    'SELECT SLEEP(0.01)'
+                )
+
+    async def test_restored_on_error(self) -> None:
+        from tortoise.backends.mysql.client import MySQLClient  # type: ignore
+
+        execute_query = MySQLClient.execute_query
+        with self.assertRaises(ValueError):
+            with self.capture_queries():
+                await Item.all()
+                raise ValueError
+
+        self.assertIs(execute_query, MySQLClient.execute_query)
+
+
+class TruncateIsolationTortoiseTest(ItemTortoiseTestCase):
+    ISOLATION = 'truncate'
+
+    async def test_insert(self) -> None:
+        await Item.create(id=1, name='item')
+
+    async def test_insert_again(self) -> None:
+        await Item.create(id=1, name='item')
+
+
+class FixturesTortoiseTest(ItemTortoiseTestCase):
+    @classproperty
+    def FIXTURES(self) -> List[Fixture]:
+        return [
+            Fixture(
+                'items',
+                lambda: ({'id': id_, 'name': f'item_{id_}'} for id_ in range(1, 2001)),
+            )
+        ]
+
+    async def test_delete(self) -> None:
+        await Item.all().delete()
+
+        self.assertEqual(0, await Item.all().count())
+
+    async def test_seeded(self) -> None:
+        self.assertEqual(2000, await Item.all().count())
+
+
+class ParallelDDLTortoiseTest(ItemTortoiseTestCase):
+    DDL_WORKERS = 4
+
+    async def test_insert(self) -> None:
+        await Item.create(id=1, name='item')
+
+        self.assertEqual(1, await Item.all().count())
+
+
+class SyntheticDataTortoiseTest(ItemTortoiseTestCase):
+    ISOLATION = 'truncate'
+
+    async def test_generate_data(self) -> None:
+        await self.generate_tortoise_data({Item: 2500}, chunk_size=1000)
+
+        self.assertEqual(2500, await Item.all().count())
+        self.assertEqual(2500, await Item.filter(name__isnull=False).count())